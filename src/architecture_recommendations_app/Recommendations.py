@@ -500,23 +500,29 @@ def clone_or_update_repo(repo_path: Path, progress_callback=None) -> tuple[bool,
     # Check if repo already exists
     if repo_path.exists():
         if (repo_path / '.git').exists() and (repo_path / 'docs').exists():
-            # Try to pull latest
+            # Try to update to latest
             if progress_callback:
-                progress_callback("Updating repository (git pull)...")
+                progress_callback("Updating repository (git fetch)...")
+            # Fetch just the upstream tip rather than pull (fetch + merge).
+            # Shallow clones stay shallow, and --keep refuses to overwrite
+            # local edits instead of discarding them.
+            fetch_cmd = ['git', 'fetch', 'origin', 'HEAD']
+            if (repo_path / '.git' / 'shallow').exists():
+                fetch_cmd.insert(2, '--depth=1')
             try:
-                result = subprocess.run(
-                    ['git', 'pull'],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                if result.returncode == 0:
-                    return True, "Repository updated"
-                else:
-                    return False, f"Git pull failed: {result.stderr}"
+                for cmd in (fetch_cmd, ['git', 'reset', '--keep', 'FETCH_HEAD']):
+                    result = subprocess.run(
+                        cmd,
+                        cwd=repo_path,
+                        capture_output=True,
+                        text=True,
+                        timeout=120
+                    )
+                    if result.returncode != 0:
+                        return False, f"Git update failed: {result.stderr}"
+                return True, "Repository updated"
             except subprocess.TimeoutExpired:
-                return False, "Git pull timed out"
+                return False, "Git update timed out"
             except Exception as e:
                 return False, f"Error updating repo: {e}"
         else:
@@ -529,12 +535,23 @@ def clone_or_update_repo(repo_path: Path, progress_callback=None) -> tuple[bool,
     repo_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
+        # Blobless clone: full commit history (so per-file last-modified
+        # dates are real) while file contents download only for the checkout
         result = subprocess.run(
-            ['git', 'clone', '--depth', '1', repo_url, str(repo_path)],
+            ['git', 'clone', '--filter=blob:none', '--sparse', repo_url, str(repo_path)],
             capture_output=True,
             text=True,
             timeout=300
         )
+        if result.returncode == 0:
+            # The catalog builder only reads docs/, so only check that out
+            result = subprocess.run(
+                ['git', 'sparse-checkout', 'set', 'docs'],
+                cwd=str(repo_path),
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
         if result.returncode == 0:
             return True, "Repository cloned successfully"
         else:
@@ -1,5 +1,6 @@
 """Catalog Builder page - Build and customize architecture catalogs."""
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -46,20 +47,26 @@ def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
 
     if clone_path.exists():
         if (clone_path / '.git').exists() and (clone_path / 'docs').exists():
+            # Fetch just the upstream tip rather than pull (fetch + merge).
+            # Shallow clones stay shallow, and --keep refuses to overwrite
+            # local edits instead of discarding them.
+            fetch_cmd = ['git', 'fetch', 'origin', 'HEAD']
+            if (clone_path / '.git' / 'shallow').exists():
+                fetch_cmd.insert(2, '--depth=1')
             try:
-                result = subprocess.run(
-                    ['git', 'pull'],
-                    cwd=str(clone_path),
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                if result.returncode == 0:
-                    return True, "Repository updated (git pull)"
-                else:
-                    return False, f"Git pull failed: {result.stderr}"
+                for cmd in (fetch_cmd, ['git', 'reset', '--keep', 'FETCH_HEAD']):
+                    result = subprocess.run(
+                        cmd,
+                        cwd=str(clone_path),
+                        capture_output=True,
+                        text=True,
+                        timeout=120
+                    )
+                    if result.returncode != 0:
+                        return False, f"Git update failed: {result.stderr}"
+                return True, "Repository updated (git fetch)"
             except subprocess.TimeoutExpired:
-                return False, "Git pull timed out"
+                return False, "Git update timed out"
             except Exception as e:
                 return False, f"Error updating repo: {e}"
         else:
@@ -68,12 +75,23 @@ def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
     clone_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
+        # Blobless clone: full commit history (so per-file last-modified
+        # dates are real) while file contents download only for the checkout
         result = subprocess.run(
-            ['git', 'clone', '--depth', '1', repo_url, str(clone_path)],
+            ['git', 'clone', '--filter=blob:none', '--sparse', repo_url, str(clone_path)],
             capture_output=True,
             text=True,
             timeout=300
         )
+        if result.returncode == 0:
+            # The catalog builder only reads docs/, so only check that out
+            result = subprocess.run(
+                ['git', 'sparse-checkout', 'set', 'docs'],
+                cwd=str(clone_path),
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
         if result.returncode == 0:
             return True, "Repository cloned successfully"
         else:
@@ -124,6 +142,22 @@ def show_help_dialog():
         st.rerun()
 
 
+@st.cache_data(ttl=300)
+def _count_docs(repo_path: str, docs_mtime: float) -> int:
+    """Count markdown docs in the repo, cached per path and docs/ mtime."""
+    # os.scandir avoids building a Path per entry the way rglob does
+    count = 0
+    stack = [os.path.join(repo_path, 'docs')]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md'):
+                    count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return count
+
+
 def render_sidebar() -> None:
     """Render the sidebar with repository controls."""
     st.sidebar.title("Catalog Builder")
@@ -132,11 +166,17 @@ def render_sidebar() -> None:
     st.sidebar.subheader("Repository")
 
     repo_path = get_state('repo_path', '')
+    saved_repo_url = get_state('repo_url', DEFAULT_REPO_URL)
+    saved_clone_dir = get_state('clone_dir', DEFAULT_CLONE_DIR)
     repo_valid = False
 
     if repo_path:
-        repo = Path(repo_path)
-        repo_valid = repo.exists() and (repo / 'docs').exists()
+        # One stat both validates the repo and keys the doc count cache
+        try:
+            docs_mtime = (Path(repo_path) / 'docs').stat().st_mtime
+            repo_valid = True
+        except (OSError, ValueError):
+            pass
 
     if not repo_path or not repo_valid:
         st.sidebar.error("Repository not found!")
@@ -144,17 +184,19 @@ def render_sidebar() -> None:
 
         repo_url = st.sidebar.text_input(
             "Repository URL",
-            value=get_state('repo_url', DEFAULT_REPO_URL),
+            value=saved_repo_url,
             help="Git URL for the Azure Architecture Center repository"
         )
-        set_state('repo_url', repo_url)
+        if repo_url != saved_repo_url:
+            set_state('repo_url', repo_url)
 
         clone_dir = st.sidebar.text_input(
             "Clone Directory",
-            value=get_state('clone_dir', DEFAULT_CLONE_DIR),
+            value=saved_clone_dir,
             help="Where to clone the architecture-center repo"
         )
-        set_state('clone_dir', clone_dir)
+        if clone_dir != saved_clone_dir:
+            set_state('clone_dir', clone_dir)
 
         if st.sidebar.button("Clone Repository", type="primary", use_container_width=True):
             with st.spinner("Cloning repository (this may take a few minutes)..."):
@@ -174,29 +216,32 @@ def render_sidebar() -> None:
         st.sidebar.markdown("**Or specify an existing path:**")
 
     else:
-        doc_count = len(list((Path(repo_path) / 'docs').rglob('*.md')))
+        doc_count = _count_docs(repo_path, docs_mtime)
         st.sidebar.success(f"Repository found ({doc_count:,} docs)")
 
         with st.sidebar.expander("Update or Change Repository"):
             repo_url = st.text_input(
                 "Repository URL",
-                value=get_state('repo_url', DEFAULT_REPO_URL),
+                value=saved_repo_url,
                 help="Git URL for the Azure Architecture Center repository"
             )
-            set_state('repo_url', repo_url)
+            if repo_url != saved_repo_url:
+                set_state('repo_url', repo_url)
 
             clone_dir = st.text_input(
                 "Clone Directory",
-                value=get_state('clone_dir', DEFAULT_CLONE_DIR),
+                value=saved_clone_dir,
                 help="Where to clone the architecture-center repo"
             )
-            set_state('clone_dir', clone_dir)
+            if clone_dir != saved_clone_dir:
+                set_state('clone_dir', clone_dir)
 
-            if st.button("Update Repository (git pull)", use_container_width=True):
+            if st.button("Update Repository (git fetch)", use_container_width=True):
                 with st.spinner("Updating repository..."):
                     success, message = clone_repository(repo_url, clone_dir)
                     if success:
                         st.success(message)
+                        _count_docs.clear()
                         try:
                             validated_path = safe_path(clone_dir, must_exist=True)
                             set_state('repo_path', str(validated_path))
@@ -229,7 +274,9 @@ def render_sidebar() -> None:
     if uploaded_file is not None:
         import yaml
         try:
-            data = yaml.safe_load(uploaded_file.read())
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            data = yaml.load(uploaded_file, Loader=loader)
             config = CatalogConfig.model_validate(data)
             set_state('config', config)
             st.sidebar.success("Config loaded!")
@@ -297,29 +344,22 @@ def main():
         "**Quick Start:** Clone repo (sidebar) → Generate catalog (Build tab)"
     )
 
-    # Tabs for different functionality
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "Build Catalog",
-        "Filter Presets",
-        "Keyword Dictionaries",
-        "Config Editor",
-        "Modernization Options"
-    ])
-
-    with tab1:
-        render_preview_panel()
-
-    with tab2:
-        render_filter_presets()
-
-    with tab3:
-        render_keywords_editor()
-
-    with tab4:
-        render_config_editor()
-
-    with tab5:
-        render_modernization_editor()
+    # Only the selected section's renderer runs on each rerun
+    sections = {
+        "Build Catalog": render_preview_panel,
+        "Filter Presets": render_filter_presets,
+        "Keyword Dictionaries": render_keywords_editor,
+        "Config Editor": render_config_editor,
+        "Modernization Options": render_modernization_editor,
+    }
+    active_tab = st.radio(
+        "Section",
+        list(sections),
+        key='active_tab',
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    sections[active_tab]()
 
 
 if __name__ == "__main__":
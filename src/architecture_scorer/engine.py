@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic import ValidationError
+
 from catalog_builder.schema import ArchitectureCatalog, ArchitectureEntry
 
 from .eligibility_filter import EligibilityFilter
@@ -66,19 +68,29 @@ class ScoringEngine:
         if not path.exists():
             raise FileNotFoundError(f"Catalog not found: {catalog_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Validating the raw bytes skips building an intermediate dict
+        raw = path.read_bytes()
+        try:
+            catalog = ArchitectureCatalog.model_validate_json(raw)
+        except ValidationError:
+            # Report an unsupported version ahead of the schema errors
+            self._check_version(json.loads(raw).get("version", "0.0.0"))
+            raise
 
         # Validate version
-        version = data.get("version", "0.0.0")
+        version = catalog.version if "version" in catalog.model_fields_set else "0.0.0"
+        self._check_version(version)
+
+        self.catalog = catalog
+
+    def _check_version(self, version: str) -> None:
+        """Raise ValueError if the catalog version is not supported."""
         if not self._version_compatible(version):
             raise ValueError(
                 f"Catalog version {version} is not compatible. "
                 f"Minimum required: {self.MIN_CATALOG_VERSION}"
             )
 
-        self.catalog = ArchitectureCatalog.model_validate(data)
-
     def _version_compatible(self, version: str) -> bool:
         """Check if catalog version is compatible."""
         try:
@@ -1,6 +1,5 @@
 """Catalog generation orchestration."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
@@ -8,7 +7,7 @@ from typing import Callable, Optional
 from .classifier import ArchitectureClassifier
 from .detector import ArchitectureDetector
 from .extractor import GitMetadataExtractor, MetadataExtractor
-from .parser import MarkdownParser
+from .parser import MarkdownParser, ParseCache, ParsedDocument
 from .schema import ArchitectureCatalog, ArchitectureEntry, GenerationSettings
 
 
@@ -21,7 +20,9 @@ class CatalogBuilder:
         progress_callback: Optional[Callable[[str], None]] = None,
         extract_content_insights: bool = False,
         use_llm: bool = True,
-        llm_provider: str = "auto"
+        llm_provider: str = "auto",
+        parse_cache_path: Optional[Path] = None,
+        parse_workers: Optional[int] = None
     ):
         """Initialize the catalog builder.
 
@@ -31,15 +32,21 @@ class CatalogBuilder:
             extract_content_insights: Enable hybrid content extraction
             use_llm: Use LLM for semantic extraction (requires API key)
             llm_provider: LLM provider ("openai", "anthropic", "mock", "auto")
+            parse_cache_path: Optional file for caching parsed documents
+                between builds (unchanged files are not re-parsed)
+            parse_workers: Parse files in this many worker processes
+                (None parses sequentially in-process)
         """
         self.repo_path = repo_path
         self.progress = progress_callback or (lambda x: None)
         self.extract_content_insights = extract_content_insights
         self.use_llm = use_llm
         self.llm_provider = llm_provider
+        self.parse_workers = parse_workers
 
         # Initialize components
-        self.parser = MarkdownParser()
+        self.parse_cache = ParseCache(parse_cache_path) if parse_cache_path else None
+        self.parser = MarkdownParser(cache=self.parse_cache)
         self.detector = ArchitectureDetector()
         self.extractor = MetadataExtractor(self.parser)
         self.classifier = ArchitectureClassifier()
@@ -66,18 +73,31 @@ class CatalogBuilder:
         processed = 0
         detected = 0
 
-        for md_file in md_files:
+        # Parsing is independent per file, so it can be done up front in
+        # worker processes; detection and extraction stay sequential
+        docs = None
+        if self.parse_workers is not None:
+            self.progress(f"Parsing with {self.parse_workers} worker processes...")
+            docs = self.parser.parse_many(md_files, workers=self.parse_workers)
+
+        for i, md_file in enumerate(md_files):
             processed += 1
             if processed % 100 == 0:
                 self.progress(f"Processed {processed}/{len(md_files)} files...")
 
-            entry = self._process_file(md_file)
+            if docs is not None:
+                entry = self._process_document(md_file, docs[i])
+            else:
+                entry = self._process_file(md_file)
             if entry:
                 entries.append(entry)
                 detected += 1
 
         self.progress(f"Detected {detected} architecture candidates")
 
+        if self.parse_cache is not None:
+            self.parse_cache.save()
+
         # Build catalog
         catalog = ArchitectureCatalog(
             source_repo=str(self.repo_path),
@@ -106,8 +126,12 @@ class CatalogBuilder:
 
     def _process_file(self, file_path: Path) -> Optional[ArchitectureEntry]:
         """Process a single markdown file."""
-        # Parse the document
-        doc = self.parser.parse_file(file_path)
+        return self._process_document(file_path, self.parser.parse_file(file_path))
+
+    def _process_document(
+        self, file_path: Path, doc: Optional[ParsedDocument]
+    ) -> Optional[ArchitectureEntry]:
+        """Process an already parsed markdown file."""
         if not doc:
             return None
 
@@ -143,12 +167,10 @@ class CatalogBuilder:
         """Save the catalog to a JSON file."""
         self.progress(f"Saving catalog to {output_path}")
 
-        # Convert to dict with proper serialization
-        catalog_dict = catalog.model_dump(mode='json')
-
-        # Write with pretty formatting
+        # Serialize in pydantic-core; the output matches json.dump(indent=2,
+        # ensure_ascii=False) of model_dump(mode='json') without the dict copy
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(catalog_dict, f, indent=2, ensure_ascii=False, default=str)
+            f.write(catalog.model_dump_json(indent=2))
 
         self.progress(f"Catalog saved successfully")
 
@@ -201,7 +223,9 @@ def build_catalog(
     generation_settings: Optional[GenerationSettings] = None,
     extract_content_insights: bool = False,
     use_llm: bool = True,
-    llm_provider: str = "auto"
+    llm_provider: str = "auto",
+    parse_cache_path: Optional[Path] = None,
+    parse_workers: Optional[int] = None
 ) -> tuple[ArchitectureCatalog, list[str]]:
     """Build and save the architecture catalog.
 
@@ -213,6 +237,8 @@ def build_catalog(
         extract_content_insights: Enable hybrid content extraction from full text
         use_llm: Use LLM for semantic extraction (requires API key)
         llm_provider: LLM provider ("openai", "anthropic", "mock", "auto")
+        parse_cache_path: Optional file for caching parsed documents between builds
+        parse_workers: Number of worker processes for parsing (None = sequential)
 
     Returns the catalog and a list of validation issues.
     """
@@ -221,7 +247,9 @@ def build_catalog(
         progress_callback,
         extract_content_insights=extract_content_insights,
         use_llm=use_llm,
-        llm_provider=llm_provider
+        llm_provider=llm_provider,
+        parse_cache_path=parse_cache_path,
+        parse_workers=parse_workers
     )
     catalog = builder.build(generation_settings=generation_settings)
 
@@ -2,6 +2,7 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.console import Console
@@ -111,6 +112,18 @@ def main():
     default=None,
     help='Azure Blob Storage SAS URL to upload the catalog after building (or set CATALOG_BLOB_URL env var)'
 )
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parse documents in N worker processes (default: sequential)'
+)
+@click.option(
+    '--parse-cache',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help='Cache parsed documents in this file so unchanged files are not re-parsed on the next build'
+)
 def build_catalog_cmd(
     repo_path: Path,
     out: Path,
@@ -126,7 +139,9 @@ def build_catalog_cmd(
     use_llm: bool,
     llm_provider: str,
     api_key: str,
-    upload_url: str
+    upload_url: str,
+    workers: Optional[int],
+    parse_cache: Optional[Path]
 ):
     """Build the architecture catalog from source documentation.
 
@@ -233,7 +248,9 @@ def build_catalog_cmd(
                 generation_settings=generation_settings,
                 extract_content_insights=extract_insights,
                 use_llm=use_llm,
-                llm_provider=llm_provider
+                llm_provider=llm_provider,
+                parse_workers=workers,
+                parse_cache_path=parse_cache
             )
         except Exception as e:
             console.print(f"\n[red]Error building catalog:[/red] {e}")
@@ -410,16 +427,13 @@ def _print_summary(catalog: ArchitectureCatalog):
 
 def _validate_existing(catalog_path: Path):
     """Validate an existing catalog file."""
-    import json
-
     if not catalog_path.exists():
         console.print(f"[red]Error:[/red] Catalog file not found: {catalog_path}")
         sys.exit(1)
 
     try:
-        with open(catalog_path, 'r') as f:
-            data = json.load(f)
-        catalog = ArchitectureCatalog.model_validate(data)
+        with open(catalog_path, 'rb') as f:
+            catalog = ArchitectureCatalog.model_validate_json(f.read())
     except Exception as e:
         console.print(f"[red]Error loading catalog:[/red] {e}")
         sys.exit(1)
@@ -468,11 +482,8 @@ def inspect(catalog: Path, arch_id: str, family: str, domain: str):
     Example:
         catalog-builder inspect --catalog architecture-catalog.json --family cloud_native
     """
-    import json
-
-    with open(catalog, 'r') as f:
-        data = json.load(f)
-    cat = ArchitectureCatalog.model_validate(data)
+    with open(catalog, 'rb') as f:
+        cat = ArchitectureCatalog.model_validate_json(f.read())
 
     if arch_id:
         # Show single architecture
@@ -600,11 +611,8 @@ def stats(catalog: Path):
     Example:
         catalog-builder stats --catalog architecture-catalog.json
     """
-    import json
-
-    with open(catalog, 'r') as f:
-        data = json.load(f)
-    cat = ArchitectureCatalog.model_validate(data)
+    with open(catalog, 'rb') as f:
+        cat = ArchitectureCatalog.model_validate_json(f.read())
 
     console.print(f"\n[bold blue]Catalog Statistics[/bold blue]")
     console.print(f"Generated: {cat.generated_at}")
@@ -7,6 +7,12 @@ from typing import Optional
 import yaml
 from pydantic import BaseModel, Field
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 
 class DetectionConfig(BaseModel):
     """Detection heuristics configuration."""
@@ -427,6 +433,11 @@ class ServiceConfig(BaseModel):
         r'(Logic\s+Apps|Power\s+Automate)',
     ])
 
+    # Find services with a single scan for full known service names instead
+    # of running detection_patterns. Faster and stricter, but short forms
+    # ("Cosmos DB", "AKS") are not picked up from content.
+    scan_known_services: bool = False
+
     # Normalize service names to canonical form
     normalizations: dict[str, str] = Field(default_factory=lambda: {
         'aks': 'Azure Kubernetes Service',
@@ -548,7 +559,7 @@ def load_config(config_path: Path) -> CatalogConfig:
     global _config
 
     with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlSafeLoader) or {}
 
     _config = CatalogConfig.model_validate(data)
     return _config
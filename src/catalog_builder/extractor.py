@@ -1,6 +1,7 @@
 """Metadata extraction from architecture documents."""
 
 import hashlib
+import posixpath
 import re
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +31,14 @@ SUPPORTING_SERVICE_PATTERNS = [
     'dns', 'traffic manager', 'ddos',
 ]
 
+# Image paths that look like architecture diagrams
+_DIAGRAM_IMAGE_PATTERN = re.compile(r'architecture|diagram|flow|\.svg|\.png\Z', re.IGNORECASE)
+
+# Architecture IDs: ASCII non-alphanumerics become dashes, then dash runs collapse
+_ID_TRANSLATION = str.maketrans({c: '-' for c in map(chr, range(128)) if not c.isalnum()})
+_ID_DASH_RUNS = re.compile(r'-{2,}')
+_ID_SPECIAL_CHARS = re.compile(r'[^a-zA-Z0-9]+')
+
 # Core service categories that realize the pattern
 CORE_SERVICE_CATEGORIES = [
     # Compute
@@ -775,7 +784,12 @@ class MetadataExtractor:
             path = path[:-3]
 
         # Replace special chars with dashes
-        path = re.sub(r'[^a-zA-Z0-9]+', '-', path)
+        if path.isascii():
+            path = path.translate(_ID_TRANSLATION)
+            if '--' in path:
+                path = _ID_DASH_RUNS.sub('-', path)
+        else:
+            path = _ID_SPECIAL_CHARS.sub('-', path)
         path = path.strip('-').lower()
 
         # Ensure uniqueness with hash suffix if path is too long
@@ -850,12 +864,13 @@ class MetadataExtractor:
         return f"{config.learn_base_url}/{path}"
 
     def _extract_diagrams(self, doc: ParsedDocument, rel_path: str) -> list[str]:
-        """Extract diagram asset paths."""
-        import os
-        diagrams = []
-        doc_dir = Path(rel_path).parent
+        """Extract diagram asset paths (deduplicated, in document order)."""
+        diagrams: dict[str, None] = {}
+        # rel_path is already posix-style, so join with plain string ops
+        doc_dir = posixpath.dirname(rel_path)
 
-        for image in doc.images:
+        # Docs often reference the same image more than once; only process each once
+        for image in dict.fromkeys(doc.images):
             # Skip external URLs
             if image.startswith('http'):
                 continue
@@ -865,18 +880,13 @@ class MetadataExtractor:
                 image = image[2:]
 
             # Build relative path and normalize (resolve .. segments)
-            image_path = os.path.normpath((doc_dir / image).as_posix())
-            # Ensure forward slashes on all platforms
-            image_path = image_path.replace('\\', '/')
+            image_path = posixpath.normpath(posixpath.join(doc_dir, image.replace('\\', '/')))
 
             # Check if it looks like a diagram
-            lower = image.lower()
-            if any(x in lower for x in ['architecture', 'diagram', 'flow', '.svg']):
-                diagrams.append(image_path)
-            elif lower.endswith(('.svg', '.png')):
-                diagrams.append(image_path)
+            if _DIAGRAM_IMAGE_PATTERN.search(image):
+                diagrams[image_path] = None
 
-        return diagrams
+        return list(diagrams)
 
 
 class GitMetadataExtractor:
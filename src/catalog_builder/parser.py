@@ -1,18 +1,46 @@
 """Markdown parsing utilities for architecture documentation."""
 
+import os
+import pickle
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import yaml
 
-from .config import get_config
+from .config import ServiceConfig, get_config
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+class _FrontmatterLoader(_YamlSafeLoader):
+    """Safe loader for frontmatter that leaves dates (ms.date) as strings.
+
+    Nothing reads frontmatter dates, so skipping timestamp resolution saves
+    a regex match and datetime construction per date. Booleans and numbers
+    are still resolved since checks like ``is_hub_page`` depend on them.
+    """
+
+
+_FrontmatterLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp) for tag, regexp in resolvers
+        if tag != 'tag:yaml.org,2002:timestamp'
+    ]
+    for first, resolvers in _YamlSafeLoader.yaml_implicit_resolvers.items()
+}
 
 
 # Canonical Azure service names (whitelist)
 # Only services in this list will be included in the catalog
-KNOWN_AZURE_SERVICES = {
+KNOWN_AZURE_SERVICES = frozenset({
     # Compute
     'Azure App Service',
     'Azure Functions',
@@ -178,13 +206,145 @@ KNOWN_AZURE_SERVICES = {
     # SAP & Specialized
     'Azure SAP HANA',
     'Azure Large Instances',
+})
+
+# Product ID to canonical name mappings (must match KNOWN_AZURE_SERVICES exactly)
+_PRODUCT_MAPPINGS = {
+    'azure-app-service': 'Azure App Service',
+    'azure-kubernetes-service': 'Azure Kubernetes Service',
+    'azure-virtual-machines': 'Azure Virtual Machines',
+    'azure-sql-database': 'Azure SQL Database',
+    'azure-cosmos-db': 'Azure Cosmos DB',
+    'azure-functions': 'Azure Functions',
+    'azure-monitor': 'Azure Monitor',
+    'azure-storage': 'Azure Storage',
+    'azure-blob-storage': 'Azure Blob Storage',
+    'azure-virtual-network': 'Azure Virtual Network',
+    'azure-expressroute': 'Azure ExpressRoute',
+    'azure-front-door': 'Azure Front Door',
+    'azure-application-gateway': 'Azure Application Gateway',
+    'azure-load-balancer': 'Azure Load Balancer',
+    'azure-firewall': 'Azure Firewall',
+    'azure-key-vault': 'Azure Key Vault',
+    'azure-event-hubs': 'Azure Event Hubs',
+    'azure-service-bus': 'Azure Service Bus',
+    'azure-event-grid': 'Azure Event Grid',
+    'azure-logic-apps': 'Azure Logic Apps',
+    'azure-data-factory': 'Azure Data Factory',
+    'azure-databricks': 'Azure Databricks',
+    'azure-synapse-analytics': 'Azure Synapse Analytics',
+    'azure-api-management': 'Azure API Management',
+    'azure-container-apps': 'Azure Container Apps',
+    'azure-container-instances': 'Azure Container Instances',
+    'azure-container-registry': 'Azure Container Registry',
+    'azure-private-link': 'Azure Private Link',
+    'azure-vpn-gateway': 'Azure VPN Gateway',
+    'azure-files': 'Azure Files',
+    'azure-netapp-files': 'Azure NetApp Files',
+    'azure-cache-redis': 'Azure Cache for Redis',
+    'azure-redis-cache': 'Azure Cache for Redis',
+    'azure-sql-managed-instance': 'Azure SQL Managed Instance',
+    'azure-database-postgresql': 'Azure Database for PostgreSQL',
+    'azure-database-mysql': 'Azure Database for MySQL',
+    'azure-iot-hub': 'Azure IoT Hub',
+    'azure-iot-central': 'Azure IoT Central',
+    'azure-digital-twins': 'Azure Digital Twins',
+    'azure-stream-analytics': 'Azure Stream Analytics',
+    'azure-hdinsight': 'Azure HDInsight',
+    'azure-data-explorer': 'Azure Data Explorer',
+    'azure-data-lake-storage': 'Azure Data Lake Storage',
+    'azure-signalr-service': 'Azure SignalR Service',
+    'azure-notification-hubs': 'Azure Notification Hubs',
+    'azure-cognitive-search': 'Azure Cognitive Search',
+    'azure-ai-search': 'Azure AI Search',
+    'azure-bot-service': 'Azure Bot Service',
+    'azure-devops': 'Azure DevOps',
+    'azure-backup': 'Azure Backup',
+    'azure-site-recovery': 'Azure Site Recovery',
+    'azure-bastion': 'Azure Bastion',
+    'azure-ddos-protection': 'Azure DDoS Protection',
+    'azure-dns': 'Azure DNS',
+    'azure-traffic-manager': 'Azure Traffic Manager',
+    'azure-cdn': 'Azure CDN',
+    'azure-nat-gateway': 'Azure NAT Gateway',
+    'azure-batch': 'Azure Batch',
+    'azure-service-fabric': 'Azure Service Fabric',
+    'azure-spring-apps': 'Azure Spring Apps',
+    'azure-static-web-apps': 'Azure Static Web Apps',
+    'azure-devtest-labs': 'Azure DevTest Labs',
+    'azure-automation': 'Azure Automation',
+    'azure-policy': 'Azure Policy',
+    'azure-advisor': 'Azure Advisor',
+    'azure-arc': 'Azure Arc',
+    'azure-migrate': 'Azure Migrate',
+    'azure-machine-learning': 'Azure Machine Learning',
+    'azure-cognitive-services': 'Azure Cognitive Services',
+    'azure-openai': 'Azure OpenAI Service',
+    'entra-id': 'Microsoft Entra ID',
+    'entra': 'Microsoft Entra ID',
+    'ai-services': 'Azure AI Services',
+    'fabric': 'Microsoft Fabric',
+    'power-bi-embedded': 'Power BI Embedded',
+    'microsoft-sentinel': 'Microsoft Sentinel',
+    'microsoft-defender-cloud': 'Microsoft Defender for Cloud',
+    'application-insights': 'Application Insights',
+    'log-analytics': 'Azure Log Analytics',
+    'github': 'GitHub',
+    'github-actions': 'GitHub Actions',
+}
+
+# Fallback for unmapped azure-* product IDs: 'azure-static-web-apps' ->
+# 'Azure Static Web Apps'. Only names that are title case after the prefix
+# are reachable, matching the ID's words title-cased
+_CANONICAL_BY_KEBAB = {
+    'azure-' + s[6:].lower().replace(' ', '-'): s
+    for s in KNOWN_AZURE_SERVICES
+    if s.startswith('Azure ') and '-' not in s and s[6:] == s[6:].title()
 }
 
 # Lowercase lookup for matching
-_KNOWN_SERVICES_LOWER = {s.lower(): s for s in KNOWN_AZURE_SERVICES}
+_KNOWN_SERVICES_LOWER = {s.lower(): sys.intern(s) for s in KNOWN_AZURE_SERVICES}
+
+# Single-pass scanner for verbatim mentions of known services. Longest names
+# come first so e.g. "Azure Active Directory B2C" wins over "Azure Active Directory".
+_KNOWN_SERVICES_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(name).replace(r'\ ', r'\s+')
+        for name in sorted(_KNOWN_SERVICES_LOWER, key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE,
+)
+
+# Words that mark a detection candidate as prose rather than a service name
+_SENTENCE_INDICATOR_PATTERN = re.compile(
+    ' (?:is|are|was|were|has|have|does|do|can|will|should|would|could|might'
+    '|automatically|executes|removes|provides|supports|enables|allows|handles'
+    '|processes|manages|creates|deploys|runs|scales|hosts|serves'
+    '|based on|before|after|when|while|during) '
+)
+
+# Clause starters; a detection candidate is cut at the first one
+_CLAUSE_MARKER_PATTERN = re.compile(' (?:that|which|where|when|and|or|to|for|with) ')
+
+# Trailing words that mark a detection candidate as prose
+_NON_SERVICE_ENDINGS = (' it', ' them', ' this', ' that', ' data', ' based')
+
+# Known names that pass every _strict_service_match rule unchanged, so an
+# exact candidate can be returned without running them
+_DIRECT_SERVICE_MATCHES = {
+    name: service for name, service in _KNOWN_SERVICES_LOWER.items()
+    if not _SENTENCE_INDICATOR_PATTERN.search(name)
+    and not _CLAUSE_MARKER_PATTERN.search(name)
+    and len(name.split()) <= 5
+    and not name.endswith(_NON_SERVICE_ENDINGS)
+}
 
+# Canonical string object for each service name, so extracted service lists
+# across thousands of catalog entries share one instance per name
+_CANONICAL_SERVICES = {s: s for s in _KNOWN_SERVICES_LOWER.values()}
 
-@dataclass
+
+@dataclass(slots=True)
 class ArchitectureMetadata:
     """Metadata from YamlMime:Architecture files."""
     ms_topic: str = ""  # reference-architecture, example-scenario, solution-idea, etc.
@@ -197,21 +357,253 @@ class ArchitectureMetadata:
     ms_collection: list[str] = field(default_factory=list)  # migration, onprem-to-azure, etc.
 
 
-@dataclass
 class ParsedDocument:
-    """Represents a parsed markdown document."""
-    path: Path
-    title: str
-    description: str
-    frontmatter: dict = field(default_factory=dict)
-    content: str = ""
-    sections: dict[str, str] = field(default_factory=dict)
-    headings: list[tuple[int, str]] = field(default_factory=list)
-    images: list[str] = field(default_factory=list)
-    links: list[str] = field(default_factory=list)
-    raw_content: str = ""
-    # New: Architecture-specific metadata from .yml files
-    arch_metadata: ArchitectureMetadata = field(default_factory=ArchitectureMetadata)
+    """Represents a parsed markdown document.
+
+    ``headings``, ``sections``, ``images`` and ``links`` are derived from
+    ``content`` on first access rather than at parse time, since most
+    documents are rejected before anything reads them. Headings and
+    sections come from the same single heading scan.
+    """
+
+    # One instance per scanned file; slots avoid a per-instance __dict__
+    __slots__ = (
+        'path', 'title', 'description', 'frontmatter', 'content', '_sections',
+        '_headings', '_images', '_links', 'raw_content', 'arch_metadata',
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        title: str,
+        description: str,
+        frontmatter: Optional[dict] = None,
+        content: str = "",
+        sections: Optional[dict[str, str]] = None,
+        headings: Optional[list[tuple[int, str]]] = None,
+        images: Optional[list[str]] = None,
+        links: Optional[list[str]] = None,
+        raw_content: str = "",
+        arch_metadata: Optional[ArchitectureMetadata] = None,
+    ):
+        self.path = path
+        self.title = title
+        self.description = description
+        self.frontmatter = frontmatter if frontmatter is not None else {}
+        self.content = content
+        self._sections = sections
+        self._headings = headings
+        self._images = images
+        self._links = links
+        self.raw_content = raw_content
+        # New: Architecture-specific metadata from .yml files
+        self.arch_metadata = arch_metadata if arch_metadata is not None else ArchitectureMetadata()
+
+    def _index_headings(self) -> None:
+        """Fill in whichever of headings/sections is still unset."""
+        headings, sections = _extract_headings_and_sections(self.content)
+        if self._headings is None:
+            self._headings = headings
+        if self._sections is None:
+            self._sections = sections
+
+    @property
+    def headings(self) -> list[tuple[int, str]]:
+        """(level, text) for every heading, in document order."""
+        if self._headings is None:
+            self._index_headings()
+        return self._headings
+
+    @headings.setter
+    def headings(self, value: list[tuple[int, str]]) -> None:
+        self._headings = value
+
+    @property
+    def sections(self) -> dict[str, str]:
+        """Content under each heading, keyed by lowercased heading text."""
+        if self._sections is None:
+            self._index_headings()
+        return self._sections
+
+    @sections.setter
+    def sections(self, value: dict[str, str]) -> None:
+        self._sections = value
+
+    @property
+    def images(self) -> list[str]:
+        """Image paths, from markdown and :::image::: syntax."""
+        if self._images is None:
+            self._images = _extract_images(self.content)
+        return self._images
+
+    @images.setter
+    def images(self, value: list[str]) -> None:
+        self._images = value
+
+    @property
+    def links(self) -> list[str]:
+        """Link targets, in document order."""
+        if self._links is None:
+            self._links = _extract_links(self.content)
+        return self._links
+
+    @links.setter
+    def links(self, value: list[str]) -> None:
+        self._links = value
+
+
+# Trailing DocFX anchor on a heading line, e.g. "## Overview {#overview}"
+_HEADING_ANCHOR_PATTERN = re.compile(r'[^\S\n]*{#[\w-]+}[^\S\n]*\Z', re.ASCII)
+
+
+def _heading_text(raw: str) -> str:
+    """Clean heading text captured by MarkdownParser.HEADING_PATTERN."""
+    if '{#' in raw:
+        anchor = _HEADING_ANCHOR_PATTERN.search(raw)
+        # An anchor with no text before it is kept as the heading text
+        if anchor and anchor.start():
+            raw = raw[:anchor.start()]
+    return raw.strip()
+
+
+def _extract_images(content: str) -> list[str]:
+    """Extract images from both standard markdown and Azure Docs :::image::: syntax."""
+    # Each pattern needs a literal marker, so skip scans that cannot match
+    images = []
+    if '![' in content:
+        images = [m.group(2) for m in MarkdownParser.IMAGE_PATTERN.finditer(content)]
+    if ':::' in content:
+        images.extend([m.group(1) for m in MarkdownParser.DOCFX_IMAGE_PATTERN.finditer(content)])
+    return images
+
+
+def _extract_links(content: str) -> list[str]:
+    """Extract link targets from markdown [text](target) syntax."""
+    if '](' not in content:
+        return []
+    return [m.group(2) for m in MarkdownParser.LINK_PATTERN.finditer(content)]
+
+
+def _extract_headings_and_sections(
+    content: str,
+) -> tuple[list[tuple[int, str]], dict[str, str]]:
+    """Extract headings and the content under each heading in one scan.
+
+    Sections are sliced straight out of ``content`` between consecutive
+    heading matches rather than rebuilt line by line.
+    """
+    headings: list[tuple[int, str]] = []
+    sections: dict[str, str] = {}
+    matches = list(MarkdownParser.HEADING_PATTERN.finditer(content))
+
+    for i, match in enumerate(matches):
+        heading = _heading_text(match.group(2))
+        headings.append((len(match.group(1)), heading))
+        if not heading:
+            continue
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections[heading.lower()] = content[match.end():end].strip()
+
+    return headings, sections
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file with raw os.read calls sized from fstat.
+
+    Skips the buffered file object that ``Path.read_bytes`` sets up, which
+    matters when thousands of small documents are read in one build.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)] if size else []
+        # Keep reading until EOF in case of a short read or a growing file
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 file with a single decode pass.
+
+    Equivalent to ``path.read_text(encoding='utf-8')`` (including universal
+    newline handling) without going through a text-mode file wrapper.
+    """
+    data = _read_bytes(path)
+    content = data.decode('utf-8')
+    if b'\r' in data:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+_worker_parser: Optional['MarkdownParser'] = None
+
+
+def _parse_one(file_path: Path) -> Optional[ParsedDocument]:
+    """Parse a single file in a worker process (used by parse_many)."""
+    global _worker_parser
+    # One parser per worker keeps its directory listings across files
+    if _worker_parser is None:
+        _worker_parser = MarkdownParser()
+    return _worker_parser.parse_file(file_path)
+
+
+class ParseCache:
+    """Persistent cache of parsed documents for repeated catalog builds.
+
+    Entries are keyed by file path and validated against the size and
+    modification time of the markdown file and its candidate .yml pairs,
+    so a stale entry is never returned for a changed file.
+    """
+
+    # Bump when parser output changes so old cache files are discarded
+    VERSION = 5
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self._entries: dict[str, tuple[tuple, ParsedDocument]] = {}
+        if cache_path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """Load entries from disk, ignoring missing or incompatible files."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self._entries = data.get('entries', {})
+
+    def get(self, path: Path, signature: tuple) -> Optional[ParsedDocument]:
+        """Return the cached document if its signature still matches."""
+        entry = self._entries.get(str(path))
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        return None
+
+    def put(self, path: Path, signature: tuple, doc: ParsedDocument) -> None:
+        """Store a parsed document under its current signature."""
+        self._entries[str(path)] = (signature, doc)
+
+    def save(self) -> None:
+        """Write the cache to disk (no-op for in-memory caches)."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(
+                {'version': self.VERSION, 'entries': self._entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, self.cache_path)
 
 
 class MarkdownParser:
@@ -219,27 +611,145 @@ class MarkdownParser:
 
     # Patterns for extraction
     FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
-    HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)(?:\s*{#[\w-]+})?\s*$', re.MULTILINE)
+    # [^\S\n] is "whitespace except newline", so a match never spans lines.
+    # Group 2 is the rest of the line; pass it through _heading_text to drop
+    # an optional {#anchor} suffix and surrounding whitespace.
+    HEADING_PATTERN = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE | re.ASCII)
     IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
     # Azure Docs extended image syntax: :::image type="..." source="path":::
     DOCFX_IMAGE_PATTERN = re.compile(r':::image[^:]*source="([^"]+)"[^:]*:::', re.IGNORECASE)
     LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-    INCLUDE_PATTERN = re.compile(r'\[!INCLUDE\s*\[([^\]]*)\]\(([^)]+)\)\]')
+    # Cap on remembered detection candidates before the memo is reset
+    SERVICE_MATCH_MEMO_SIZE = 8192
+    # Leading YamlMime:Architecture header; matched in place so the check
+    # does not copy the whole file the way content.strip() would
+    YAMLMIME_HEADER_PATTERN = re.compile(r'\s*### YamlMime:Architecture')
+    # Content reference in a YamlMime:Architecture file ([!include] or [!INCLUDE])
+    INCLUDE_CONTENT_PATTERN = re.compile(r'\[!INCLUDE\[.*?\]\((.*?)\)\]', re.IGNORECASE)
+
+    def __init__(self, cache: Optional[ParseCache] = None):
+        self.cache = cache
+        self._detection_patterns: Optional[list[re.Pattern]] = None
+        self._detection_patterns_source: tuple[str, ...] = ()
+        # Directory -> .yml file names, so .yml pairing needs one scandir
+        # per directory instead of a stat per candidate
+        self._yml_names_cache: dict[Path, frozenset[str]] = {}
+        # Raw detection candidate -> matched service (or None), shared across
+        # documents since the same mentions recur throughout a corpus
+        self._service_matches: dict[str, Optional[str]] = {}
+        self._service_matches_source: dict[str, str] = {}
 
     def _get_config(self):
         """Get services config."""
         return get_config().services
 
-    def parse_file(self, file_path: Path) -> Optional[ParsedDocument]:
-        """Parse a markdown file into a structured document."""
+    def _get_detection_patterns(self) -> list[re.Pattern]:
+        """Get the configured service detection patterns, compiled.
+
+        Recompiles only when the active config's pattern list changes (e.g.
+        after load_config() or an edit in the GUI).
+        """
+        source = tuple(self._get_config().detection_patterns)
+        if self._detection_patterns is None or source != self._detection_patterns_source:
+            self._detection_patterns = [re.compile(p, re.IGNORECASE) for p in source]
+            self._detection_patterns_source = source
+        return self._detection_patterns
+
+    def _get_service_matches(self, config: ServiceConfig) -> dict[str, Optional[str]]:
+        """Get the candidate -> service memo for the active config.
+
+        Starts over when the config's normalizations change or the memo
+        grows past SERVICE_MATCH_MEMO_SIZE.
+        """
+        if (
+            config.normalizations != self._service_matches_source
+            or len(self._service_matches) > self.SERVICE_MATCH_MEMO_SIZE
+        ):
+            self._service_matches = {}
+            self._service_matches_source = dict(config.normalizations)
+        return self._service_matches
+
+    def parse_file(
+        self, file_path: Path, metadata_only: bool = False
+    ) -> Optional[ParsedDocument]:
+        """Parse a markdown file into a structured document.
+
+        When the parser has a cache, unchanged files are returned from it
+        without re-reading or re-parsing. With metadata_only, only the
+        frontmatter is read where possible (see parse_file_header).
+        """
+        if metadata_only:
+            return self.parse_file_header(file_path)
+
+        signature = None
+        if self.cache is not None:
+            signature = self._file_signature(file_path)
+            if signature is not None:
+                cached = self.cache.get(file_path, signature)
+                if cached is not None:
+                    return cached
+
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = _read_text(file_path)
         except (IOError, UnicodeDecodeError):
             return None
 
         doc = self.parse_content(content, file_path)
+        self._merge_architecture_yml(doc, file_path)
+
+        if signature is not None:
+            self.cache.put(file_path, signature, doc)
+
+        return doc
+
+    def parse_file_header(
+        self, file_path: Path, max_bytes: int = 8192
+    ) -> Optional[ParsedDocument]:
+        """Parse only the frontmatter of a markdown file.
+
+        Reads the first max_bytes characters and, if they hold a complete
+        frontmatter block with a title, returns a document with metadata
+        only (no content, headings, images or links). Otherwise falls back
+        to a full parse_file.
+        """
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                head = f.read(max_bytes)
+        except (IOError, UnicodeDecodeError):
+            return None
+
+        if len(head) < max_bytes:
+            # Whole file fits in the first read
+            doc = self.parse_content(head, file_path)
+            self._merge_architecture_yml(doc, file_path)
+            return doc
+
+        fm_match = self._match_frontmatter(head)
+        if not fm_match:
+            return self.parse_file(file_path)
+        frontmatter = self._load_frontmatter(fm_match.group(1))
+        title = frontmatter.get('title', '')
+        if not title:
+            # Title would come from the first heading in the body
+            return self.parse_file(file_path)
 
-        # Try to find and parse paired .yml architecture file
+        arch_metadata = ArchitectureMetadata()
+        if 'ms.topic' in frontmatter:
+            arch_metadata.ms_topic = frontmatter['ms.topic']
+
+        doc = ParsedDocument(
+            path=file_path,
+            title=title,
+            description=frontmatter.get('description', '') or frontmatter.get('summary', ''),
+            frontmatter=frontmatter,
+            raw_content=fm_match.group(0),
+            arch_metadata=arch_metadata,
+        )
+        self._merge_architecture_yml(doc, file_path)
+        return doc
+
+    def _merge_architecture_yml(self, doc: ParsedDocument, file_path: Path) -> None:
+        """Attach a paired .yml architecture file's metadata to a document."""
         arch_metadata = self._find_architecture_yml(file_path)
         if arch_metadata:
             doc.arch_metadata = arch_metadata
@@ -251,17 +761,71 @@ class MarkdownParser:
             if arch_metadata.products:
                 doc.frontmatter['products'] = arch_metadata.products
 
-        return doc
+    def parse_many(
+        self,
+        file_paths: Iterable[Path],
+        workers: Optional[int] = None,
+    ) -> list[Optional[ParsedDocument]]:
+        """Parse many markdown files across a pool of worker processes.
 
-    def _find_architecture_yml(self, md_path: Path) -> Optional[ArchitectureMetadata]:
-        """Find and parse a paired YamlMime:Architecture file.
+        Results are returned in input order, with None for unreadable
+        files, exactly as parse_file would return them. Cache hits are
+        served locally and only the remaining files are sent to workers.
 
-        Architecture yml files can be:
-        1. Same name as md file: foo.yml for foo.md
-        2. Same name without -content suffix: foo.yml for foo-content.md
-        3. In the same directory with matching base name
+        Args:
+            file_paths: Markdown files to parse
+            workers: Number of worker processes (defaults to CPU count)
         """
-        # Try common yml file patterns
+        file_paths = list(file_paths)
+        results: list[Optional[ParsedDocument]] = [None] * len(file_paths)
+        pending: list[tuple[int, Path, Optional[tuple]]] = []
+
+        for i, file_path in enumerate(file_paths):
+            signature = None
+            if self.cache is not None:
+                signature = self._file_signature(file_path)
+                if signature is not None:
+                    cached = self.cache.get(file_path, signature)
+                    if cached is not None:
+                        results[i] = cached
+                        continue
+            pending.append((i, file_path, signature))
+
+        if not pending:
+            return results
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            docs = executor.map(
+                _parse_one, [p for _, p, _ in pending], chunksize=16
+            )
+            for (i, file_path, signature), doc in zip(pending, docs):
+                results[i] = doc
+                if doc is not None and signature is not None:
+                    self.cache.put(file_path, signature, doc)
+
+        return results
+
+    def _file_signature(self, md_path: Path) -> Optional[tuple]:
+        """Build a cache signature from the md file and its .yml candidates."""
+        try:
+            st = md_path.stat()
+        except OSError:
+            return None
+        yml_stats = []
+        for yml_path in self._architecture_yml_candidates(md_path):
+            # Absent candidates are answered from the directory listing
+            if yml_path.name not in self._yml_names(yml_path.parent):
+                yml_stats.append(None)
+                continue
+            try:
+                yml_st = yml_path.stat()
+                yml_stats.append((yml_st.st_mtime_ns, yml_st.st_size))
+            except OSError:
+                yml_stats.append(None)
+        return (st.st_mtime_ns, st.st_size, tuple(yml_stats))
+
+    def _architecture_yml_candidates(self, md_path: Path) -> list[Path]:
+        """List the .yml paths that may pair with a markdown file, in priority order."""
         base_name = md_path.stem
         parent = md_path.parent
 
@@ -278,35 +842,80 @@ class MarkdownParser:
         if base_name == 'index':
             yml_candidates.insert(0, parent.with_suffix('.yml'))
 
-        for yml_path in yml_candidates:
-            if yml_path.exists():
+        return yml_candidates
+
+    def _find_architecture_yml(self, md_path: Path) -> Optional[ArchitectureMetadata]:
+        """Find and parse a paired YamlMime:Architecture file.
+
+        Architecture yml files can be:
+        1. Same name as md file: foo.yml for foo.md
+        2. Same name without -content suffix: foo.yml for foo-content.md
+        3. In the same directory with matching base name
+        """
+        # Most directories hold no .yml at all; only index.md can pair
+        # with a .yml outside its own directory
+        if md_path.stem != 'index' and not self._yml_names(md_path.parent):
+            return None
+
+        for yml_path in self._architecture_yml_candidates(md_path):
+            if yml_path.name in self._yml_names(yml_path.parent):
                 metadata = self._parse_architecture_yml(yml_path)
                 if metadata and metadata.is_architecture_yml:
                     return metadata
 
         return None
 
-    def _parse_architecture_yml(self, yml_path: Path) -> Optional[ArchitectureMetadata]:
-        """Parse a YamlMime:Architecture YAML file."""
+    def _load_architecture_yml(self, yml_path: Path) -> Optional[tuple[dict, str]]:
+        """Read and parse a YamlMime:Architecture file.
+
+        Returns the parsed YAML data and the raw file content, or None if
+        the file is unreadable, not an architecture yml, or empty.
+        """
         try:
-            content = yml_path.read_text(encoding='utf-8')
+            content = _read_text(yml_path)
         except (IOError, UnicodeDecodeError):
             return None
 
         # Check if it's a YamlMime:Architecture file
-        if not content.strip().startswith('### YamlMime:Architecture'):
+        if not self.YAMLMIME_HEADER_PATTERN.match(content):
             return None
 
-        # Remove the YamlMime header before parsing
-        yaml_content = '\n'.join(content.split('\n')[1:])
+        # Remove the YamlMime header line before parsing
+        newline = content.find('\n')
+        yaml_content = content[newline + 1:] if newline != -1 else ''
 
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=_YamlSafeLoader)
             if not data:
                 return None
         except yaml.YAMLError:
             return None
 
+        return data, content
+
+    def _yml_names(self, directory: Path) -> frozenset[str]:
+        """Return the .yml entry names in a directory, cached per parser."""
+        names = self._yml_names_cache.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = frozenset(
+                        entry.name for entry in entries if entry.name.endswith('.yml')
+                    )
+            except OSError:
+                names = frozenset()
+            self._yml_names_cache[directory] = names
+        return names
+
+    def _parse_architecture_yml(self, yml_path: Path) -> Optional[ArchitectureMetadata]:
+        """Parse a YamlMime:Architecture YAML file."""
+        loaded = self._load_architecture_yml(yml_path)
+        if loaded is None:
+            return None
+        return self._architecture_metadata_from_data(loaded[0])
+
+    def _architecture_metadata_from_data(self, data: dict) -> ArchitectureMetadata:
+        """Build architecture metadata from parsed YamlMime:Architecture data."""
         metadata = data.get('metadata', {})
 
         # Extract ms.topic
@@ -320,7 +929,9 @@ class MarkdownParser:
         ms_category = metadata.get('ms.category', [])
         if isinstance(ms_category, str):
             ms_category = [ms_category]
-        azure_cats = list(set(azure_cats + ms_category))
+        # Dedupe in source order: the first matching category decides the
+        # workload domain, so order must be stable for reproducible builds
+        azure_cats = list(dict.fromkeys(azure_cats + ms_category))
 
         # Extract products
         products = data.get('products', [])
@@ -361,15 +972,13 @@ class MarkdownParser:
 
         This is for when we want to process .yml files as the primary source.
         """
-        metadata = self._parse_architecture_yml(yml_path)
-        if not metadata or not metadata.is_architecture_yml:
+        loaded = self._load_architecture_yml(yml_path)
+        if loaded is None:
             return None
+        data, content = loaded
 
-        try:
-            content = yml_path.read_text(encoding='utf-8')
-            yaml_content = '\n'.join(content.split('\n')[1:])
-            data = yaml.safe_load(yaml_content)
-        except Exception:
+        metadata = self._architecture_metadata_from_data(data)
+        if not metadata.is_architecture_yml:
             return None
 
         yml_metadata = data.get('metadata', {})
@@ -380,15 +989,13 @@ class MarkdownParser:
         images = []
 
         # Try to load the included content file (case-insensitive for [!include] or [!INCLUDE])
-        include_match = re.search(r'\[!INCLUDE\[.*?\]\((.*?)\)\]', content_ref, re.IGNORECASE)
+        include_match = self.INCLUDE_CONTENT_PATTERN.search(content_ref)
         if include_match:
             content_file = yml_path.parent / include_match.group(1)
             if content_file.exists():
                 try:
-                    content_body = content_file.read_text(encoding='utf-8')
-                    # Extract images from both standard markdown and Azure Docs :::image::: syntax
-                    images = [m.group(2) for m in self.IMAGE_PATTERN.finditer(content_body)]
-                    images.extend([m.group(1) for m in self.DOCFX_IMAGE_PATTERN.finditer(content_body)])
+                    content_body = _read_text(content_file)
+                    images = _extract_images(content_body)
                 except Exception:
                     pass
 
@@ -406,6 +1013,19 @@ class MarkdownParser:
             arch_metadata=metadata,
         )
 
+    def _match_frontmatter(self, content: str) -> Optional[re.Match]:
+        """Match a leading frontmatter block, skipping the regex when absent."""
+        if not content.startswith('---'):
+            return None
+        return self.FRONTMATTER_PATTERN.match(content)
+
+    def _load_frontmatter(self, block: str) -> dict:
+        """Load a frontmatter block, returning {} if it is empty or invalid."""
+        try:
+            return yaml.load(block, Loader=_FrontmatterLoader) or {}
+        except yaml.YAMLError:
+            return {}
+
     def parse_content(self, content: str, file_path: Path) -> ParsedDocument:
         """Parse markdown content into a structured document."""
         raw_content = content
@@ -413,12 +1033,9 @@ class MarkdownParser:
         body = content
 
         # Extract frontmatter
-        fm_match = self.FRONTMATTER_PATTERN.match(content)
+        fm_match = self._match_frontmatter(content)
         if fm_match:
-            try:
-                frontmatter = yaml.safe_load(fm_match.group(1)) or {}
-            except yaml.YAMLError:
-                frontmatter = {}
+            frontmatter = self._load_frontmatter(fm_match.group(1))
             body = content[fm_match.end():]
 
         # Extract title from frontmatter or first heading
@@ -426,29 +1043,13 @@ class MarkdownParser:
         if not title:
             first_heading = self.HEADING_PATTERN.search(body)
             if first_heading:
-                title = first_heading.group(2).strip()
+                title = _heading_text(first_heading.group(2))
 
         # Extract description
         description = frontmatter.get('description', '')
         if not description:
             description = frontmatter.get('summary', '')
 
-        # Extract all headings
-        headings = [
-            (len(m.group(1)), m.group(2).strip())
-            for m in self.HEADING_PATTERN.finditer(body)
-        ]
-
-        # Extract sections (content under each heading)
-        sections = self._extract_sections(body)
-
-        # Extract images from both standard markdown and Azure Docs :::image::: syntax
-        images = [m.group(2) for m in self.IMAGE_PATTERN.finditer(body)]
-        images.extend([m.group(1) for m in self.DOCFX_IMAGE_PATTERN.finditer(body)])
-
-        # Extract links
-        links = [m.group(2) for m in self.LINK_PATTERN.finditer(body)]
-
         # Extract ms.topic from frontmatter if available
         arch_metadata = ArchitectureMetadata()
         if 'ms.topic' in frontmatter:
@@ -460,39 +1061,10 @@ class MarkdownParser:
             description=description,
             frontmatter=frontmatter,
             content=body,
-            sections=sections,
-            headings=headings,
-            images=images,
-            links=links,
             raw_content=raw_content,
             arch_metadata=arch_metadata,
         )
 
-    def _extract_sections(self, content: str) -> dict[str, str]:
-        """Extract content under each heading as sections."""
-        sections: dict[str, str] = {}
-        lines = content.split('\n')
-        current_heading = None
-        current_content: list[str] = []
-
-        for line in lines:
-            heading_match = self.HEADING_PATTERN.match(line)
-            if heading_match:
-                # Save previous section
-                if current_heading:
-                    sections[current_heading.lower()] = '\n'.join(current_content).strip()
-
-                current_heading = heading_match.group(2).strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Save last section
-        if current_heading:
-            sections[current_heading.lower()] = '\n'.join(current_content).strip()
-
-        return sections
-
     def extract_azure_services(self, doc: ParsedDocument) -> list[str]:
         """Extract Azure service names from document content.
 
@@ -516,30 +1088,62 @@ class MarkdownParser:
                     services.add(normalized)
 
         # Priority 3: Content extraction (most risky - apply strict filtering)
-        content_services = self._extract_services_from_content(doc.content + ' ' + doc.description)
+        # Body and description are scanned separately rather than joined,
+        # which avoids copying the body and matches spanning the two
+        content_services = self._extract_services_from_content(doc.content, doc.description)
         services.update(content_services)
 
-        return sorted(services)
+        return sorted(_CANONICAL_SERVICES.get(s, s) for s in services)
 
-    def _extract_services_from_content(self, content: str) -> set[str]:
-        """Extract services from content with strict allow-list matching.
+    def _extract_services_from_content(self, *texts: str) -> set[str]:
+        """Extract services from one or more texts with strict allow-list matching.
 
         Only returns services that EXACTLY match the known services list.
         Any prose, sentences, or unrecognized text is dropped.
         """
         config = self._get_config()
+        if config.scan_known_services:
+            return set().union(*(self.find_known_services(text) for text in texts))
+
         services = set()
+        # The same mention (e.g. "Kubernetes Service") recurs across documents
+        # and patterns; validate each distinct candidate once
+        matches = self._get_service_matches(config)
+
+        for text in texts:
+            for pattern in self._get_detection_patterns():
+                for match in pattern.finditer(text):
+                    raw = match.group(1) if match.lastindex else match.group(0)
+                    try:
+                        normalized = matches[raw]
+                    except KeyError:
+                        normalized = matches[raw] = self._strict_service_match(raw, config)
+                    if normalized:
+                        services.add(normalized)
 
-        for pattern in config.detection_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                raw = match.group(1) if match.lastindex else match.group(0)
-                normalized = self._strict_service_match(raw)
-                if normalized:
-                    services.add(normalized)
+        return services
 
+    def find_known_services(self, content: str) -> set[str]:
+        """Find verbatim mentions of known services in one pass over content.
+
+        Used instead of detection_patterns when services.scan_known_services
+        is enabled, and usable directly regardless of config. Only full
+        canonical names are matched, so this is faster and stricter but
+        misses short forms like "Cosmos DB".
+        """
+        services = set()
+        for match in _KNOWN_SERVICES_PATTERN.finditer(content):
+            name = match.group(0).lower()
+            service = _KNOWN_SERVICES_LOWER.get(name)
+            if service is None:
+                # Name was split by a line break or repeated spaces
+                service = _KNOWN_SERVICES_LOWER[' '.join(name.split())]
+            services.add(service)
         return services
 
-    def _strict_service_match(self, raw: str) -> Optional[str]:
+    def _strict_service_match(
+        self, raw: str, config: Optional[ServiceConfig] = None
+    ) -> Optional[str]:
         """Strict matching against known Azure services.
 
         Rules:
@@ -551,39 +1155,36 @@ class MarkdownParser:
         if not raw:
             return None
 
+        # Matching is case-insensitive throughout, so lowercase once up front
+        raw = raw.lower()
+
+        # Fast path: candidate is exactly a known service name
+        direct = _DIRECT_SERVICE_MATCHES.get(raw)
+        if direct is not None:
+            return direct
+
         # Quick rejection: contains obvious sentence patterns
-        sentence_indicators = [
-            ' is ', ' are ', ' was ', ' were ', ' has ', ' have ', ' does ', ' do ',
-            ' can ', ' will ', ' should ', ' would ', ' could ', ' might ',
-            ' automatically ', ' executes ', ' removes ', ' provides ', ' supports ',
-            ' enables ', ' allows ', ' handles ', ' processes ', ' manages ',
-            ' creates ', ' deploys ', ' runs ', ' scales ', ' hosts ', ' serves ',
-            ' based on ', ' before ', ' after ', ' when ', ' while ', ' during ',
-        ]
-        raw_lower = raw.lower()
-        for indicator in sentence_indicators:
-            if indicator in raw_lower:
-                return None
+        if _SENTENCE_INDICATOR_PATTERN.search(raw):
+            return None
 
         # Strip everything after first newline
         text = raw.split('\n')[0].strip()
 
-        # Strip everything after common clause starters
-        for marker in [' that ', ' which ', ' where ', ' when ', ' and ', ' or ', ' to ', ' for ', ' with ']:
-            if marker in text.lower():
-                idx = text.lower().find(marker)
-                text = text[:idx].strip()
+        # Strip everything after the first common clause starter
+        clause = _CLAUSE_MARKER_PATTERN.search(text)
+        if clause:
+            text = text[:clause.start()].strip()
 
         # Reject if still too long (> 5 words)
         if len(text.split()) > 5:
             return None
 
         # Reject if ends with common non-service words
-        if text.lower().endswith((' it', ' them', ' this', ' that', ' data', ' based')):
+        if text.endswith(_NON_SERVICE_ENDINGS):
             return None
 
-        # Try to match against known services
-        return self._match_known_service(text)
+        # Try to match against known services (text is already lowercase)
+        return self._match_known_service_lower(text, config)
 
     def _match_known_service(self, text: str) -> Optional[str]:
         """Match text against known Azure services with exact matching.
@@ -592,9 +1193,21 @@ class MarkdownParser:
         """
         if not text:
             return None
+        return self._match_known_service_lower(text.lower().strip())
 
-        text_lower = text.lower().strip()
-        config = self._get_config()
+    def _match_known_service_lower(
+        self, text_lower: str, config: Optional[ServiceConfig] = None
+    ) -> Optional[str]:
+        """Match already lowercased, stripped text against known services.
+
+        Pass the services config when matching many candidates to avoid
+        looking it up for each one.
+        """
+        if not text_lower:
+            return None
+
+        if config is None:
+            config = self._get_config()
 
         # Direct match in known services
         if text_lower in _KNOWN_SERVICES_LOWER:
@@ -625,108 +1238,19 @@ class MarkdownParser:
             return None
 
         # Skip generic entries
-        if product_id.lower() in ('azure', 'microsoft'):
+        product_lower = product_id.lower()
+        if product_lower in ('azure', 'microsoft'):
             return None
 
-        # Product ID to canonical name mappings (must match KNOWN_AZURE_SERVICES exactly)
-        product_mappings = {
-            'azure-app-service': 'Azure App Service',
-            'azure-kubernetes-service': 'Azure Kubernetes Service',
-            'azure-virtual-machines': 'Azure Virtual Machines',
-            'azure-sql-database': 'Azure SQL Database',
-            'azure-cosmos-db': 'Azure Cosmos DB',
-            'azure-functions': 'Azure Functions',
-            'azure-monitor': 'Azure Monitor',
-            'azure-storage': 'Azure Storage',
-            'azure-blob-storage': 'Azure Blob Storage',
-            'azure-virtual-network': 'Azure Virtual Network',
-            'azure-expressroute': 'Azure ExpressRoute',
-            'azure-front-door': 'Azure Front Door',
-            'azure-application-gateway': 'Azure Application Gateway',
-            'azure-load-balancer': 'Azure Load Balancer',
-            'azure-firewall': 'Azure Firewall',
-            'azure-key-vault': 'Azure Key Vault',
-            'azure-event-hubs': 'Azure Event Hubs',
-            'azure-service-bus': 'Azure Service Bus',
-            'azure-event-grid': 'Azure Event Grid',
-            'azure-logic-apps': 'Azure Logic Apps',
-            'azure-data-factory': 'Azure Data Factory',
-            'azure-databricks': 'Azure Databricks',
-            'azure-synapse-analytics': 'Azure Synapse Analytics',
-            'azure-api-management': 'Azure API Management',
-            'azure-container-apps': 'Azure Container Apps',
-            'azure-container-instances': 'Azure Container Instances',
-            'azure-container-registry': 'Azure Container Registry',
-            'azure-private-link': 'Azure Private Link',
-            'azure-vpn-gateway': 'Azure VPN Gateway',
-            'azure-files': 'Azure Files',
-            'azure-netapp-files': 'Azure NetApp Files',
-            'azure-cache-redis': 'Azure Cache for Redis',
-            'azure-redis-cache': 'Azure Cache for Redis',
-            'azure-sql-managed-instance': 'Azure SQL Managed Instance',
-            'azure-database-postgresql': 'Azure Database for PostgreSQL',
-            'azure-database-mysql': 'Azure Database for MySQL',
-            'azure-iot-hub': 'Azure IoT Hub',
-            'azure-iot-central': 'Azure IoT Central',
-            'azure-digital-twins': 'Azure Digital Twins',
-            'azure-stream-analytics': 'Azure Stream Analytics',
-            'azure-hdinsight': 'Azure HDInsight',
-            'azure-data-explorer': 'Azure Data Explorer',
-            'azure-data-lake-storage': 'Azure Data Lake Storage',
-            'azure-signalr-service': 'Azure SignalR Service',
-            'azure-notification-hubs': 'Azure Notification Hubs',
-            'azure-cognitive-search': 'Azure Cognitive Search',
-            'azure-ai-search': 'Azure AI Search',
-            'azure-bot-service': 'Azure Bot Service',
-            'azure-devops': 'Azure DevOps',
-            'azure-backup': 'Azure Backup',
-            'azure-site-recovery': 'Azure Site Recovery',
-            'azure-bastion': 'Azure Bastion',
-            'azure-ddos-protection': 'Azure DDoS Protection',
-            'azure-dns': 'Azure DNS',
-            'azure-traffic-manager': 'Azure Traffic Manager',
-            'azure-cdn': 'Azure CDN',
-            'azure-nat-gateway': 'Azure NAT Gateway',
-            'azure-batch': 'Azure Batch',
-            'azure-service-fabric': 'Azure Service Fabric',
-            'azure-spring-apps': 'Azure Spring Apps',
-            'azure-static-web-apps': 'Azure Static Web Apps',
-            'azure-devtest-labs': 'Azure DevTest Labs',
-            'azure-automation': 'Azure Automation',
-            'azure-policy': 'Azure Policy',
-            'azure-advisor': 'Azure Advisor',
-            'azure-arc': 'Azure Arc',
-            'azure-migrate': 'Azure Migrate',
-            'azure-machine-learning': 'Azure Machine Learning',
-            'azure-cognitive-services': 'Azure Cognitive Services',
-            'azure-openai': 'Azure OpenAI Service',
-            'entra-id': 'Microsoft Entra ID',
-            'entra': 'Microsoft Entra ID',
-            'ai-services': 'Azure AI Services',
-            'fabric': 'Microsoft Fabric',
-            'power-bi-embedded': 'Power BI Embedded',
-            'microsoft-sentinel': 'Microsoft Sentinel',
-            'microsoft-defender-cloud': 'Microsoft Defender for Cloud',
-            'application-insights': 'Application Insights',
-            'log-analytics': 'Azure Log Analytics',
-            'github': 'GitHub',
-            'github-actions': 'GitHub Actions',
-        }
-
         # Direct lookup
-        if product_id in product_mappings:
-            canonical = product_mappings[product_id]
+        canonical = _PRODUCT_MAPPINGS.get(product_id)
+        if canonical is not None:
             # Verify it exists in KNOWN_AZURE_SERVICES
-            if canonical in KNOWN_AZURE_SERVICES:
-                return canonical
-            return None
+            return canonical if canonical in KNOWN_AZURE_SERVICES else None
 
         # Try kebab-case conversion for azure-* products
         if product_id.startswith('azure-'):
-            name = product_id[6:].replace('-', ' ').title()
-            candidate = f"Azure {name}"
-            if candidate in KNOWN_AZURE_SERVICES:
-                return candidate
+            return _CANONICAL_BY_KEBAB.get(product_lower.replace(' ', '-'))
 
         # No match - drop it
         return None
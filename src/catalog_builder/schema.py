@@ -1,10 +1,10 @@
 """Pydantic models for the architecture catalog schema."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class ArchitectureFamily(str, Enum):
@@ -199,6 +199,8 @@ class CatalogQuality(str, Enum):
 
 class ExpectedCharacteristics(BaseModel):
     """Expected architectural characteristics."""
+    model_config = ConfigDict(frozen=True)
+
     containers: TrinaryOption = TrinaryOption.OPTIONAL
     stateless: TrinaryOption = TrinaryOption.OPTIONAL
     devops_required: bool = False
@@ -208,16 +210,27 @@ class ExpectedCharacteristics(BaseModel):
 
 class Complexity(BaseModel):
     """Complexity ratings for implementation and operations."""
+    model_config = ConfigDict(frozen=True)
+
     implementation: ComplexityLevel = ComplexityLevel.MEDIUM
     operations: ComplexityLevel = ComplexityLevel.MEDIUM
 
 
 class ClassificationMeta(BaseModel):
     """Metadata about how a value was determined."""
+    model_config = ConfigDict(frozen=True)
+
     confidence: ExtractionConfidence
     source: Optional[str] = None  # e.g., "filename", "frontmatter", "content_analysis"
 
 
+# Shared field defaults (safe to share, since these models are frozen)
+_DEFAULT_CHARACTERISTICS = ExpectedCharacteristics()
+_DEFAULT_COMPLEXITY = Complexity()
+_MANUAL_REQUIRED_META = ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+_AI_SUGGESTED_META = ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+
+
 class ContentDerivedInsights(BaseModel):
     """Metadata extracted from full document content analysis.
 
@@ -282,7 +295,7 @@ class ArchitectureEntry(BaseModel):
         description="Normalized pattern name representing architectural intent"
     )
     pattern_name_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+        default=_MANUAL_REQUIRED_META
     )
     description: str = Field(..., description="Brief description of the architecture")
     source_repo_path: str = Field(..., description="Path in source repository")
@@ -304,14 +317,14 @@ class ArchitectureEntry(BaseModel):
         description="Architecture family"
     )
     family_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+        default=_MANUAL_REQUIRED_META
     )
     workload_domain: WorkloadDomain = Field(
         default=WorkloadDomain.GENERAL,
         description="Workload domain"
     )
     workload_domain_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+        default=_MANUAL_REQUIRED_META
     )
 
     # Architectural Expectations
@@ -320,10 +333,10 @@ class ArchitectureEntry(BaseModel):
         description="Expected runtime models"
     )
     runtime_models_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+        default=_MANUAL_REQUIRED_META
     )
     expected_characteristics: ExpectedCharacteristics = Field(
-        default_factory=ExpectedCharacteristics,
+        default=_DEFAULT_CHARACTERISTICS,
         description="Expected architectural characteristics"
     )
 
@@ -333,14 +346,14 @@ class ArchitectureEntry(BaseModel):
         description="Supported migration/modernization treatments"
     )
     treatments_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
     supported_time_categories: list[TimeCategory] = Field(
         default_factory=list,
         description="Supported time investment categories"
     )
     time_categories_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
 
     # Operational Expectations
@@ -349,21 +362,21 @@ class ArchitectureEntry(BaseModel):
         description="Supported availability models"
     )
     availability_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
     security_level: SecurityLevel = Field(
         default=SecurityLevel.BASIC,
         description="Security level classification"
     )
     security_level_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
     operating_model_required: OperatingModel = Field(
         default=OperatingModel.TRADITIONAL_IT,
         description="Required operating model"
     )
     operating_model_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
 
     # Cost & Complexity
@@ -372,14 +385,14 @@ class ArchitectureEntry(BaseModel):
         description="Cost optimization profile"
     )
     cost_profile_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
     complexity: Complexity = Field(
-        default_factory=Complexity,
+        default=_DEFAULT_COMPLEXITY,
         description="Complexity ratings"
     )
     complexity_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.MANUAL_REQUIRED)
+        default=_MANUAL_REQUIRED_META
     )
 
     # Exclusion Rules (manual only)
@@ -398,7 +411,7 @@ class ArchitectureEntry(BaseModel):
         description="Supporting services for observability, security, and operations"
     )
     services_confidence: ClassificationMeta = Field(
-        default_factory=lambda: ClassificationMeta(confidence=ExtractionConfidence.AI_SUGGESTED)
+        default=_AI_SUGGESTED_META
     )
 
     # Metadata
@@ -481,7 +494,7 @@ class ArchitectureCatalog(BaseModel):
     """Complete architecture catalog."""
     version: str = Field(default="1.0.0", description="Catalog schema version")
     generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Generation timestamp"
     )
     source_repo: str = Field(..., description="Source repository URL or path")
@@ -490,12 +503,13 @@ class ArchitectureCatalog(BaseModel):
         None,
         description="Filter settings used to generate this catalog"
     )
-    total_architectures: int = Field(default=0, description="Total number of architectures")
     architectures: list[ArchitectureEntry] = Field(
         default_factory=list,
         description="Architecture entries"
     )
 
-    def model_post_init(self, __context) -> None:
-        """Update total count after initialization."""
-        self.total_architectures = len(self.architectures)
+    @computed_field(description="Total number of architectures")
+    @property
+    def total_architectures(self) -> int:
+        """Derived from architectures, so it never goes stale."""
+        return len(self.architectures)
@@ -1,8 +1,14 @@
 """Main Streamlit application for catalog builder configuration."""
 
+import os
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 import streamlit as st
 
@@ -28,13 +34,108 @@ from architecture_recommendations_app.utils.sanitize import (
 DEFAULT_REPO_URL = "https://github.com/MicrosoftDocs/architecture-center.git"
 DEFAULT_CLONE_DIR = str(Path.home() / "architecture-center")
 
+# Seconds between reruns while a clone/update runs in the background
+REPO_JOB_POLL_INTERVAL = 1.0
 
-def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
+# Body of the "Getting Started" expander on the main page
+GETTING_STARTED_MD = """
+### What This Tool Does
+
+The Catalog Builder scans the [Azure Architecture Center](https://learn.microsoft.com/en-us/azure/architecture/)
+repository and creates a structured catalog of architecture patterns. This catalog is used by the
+**Architecture Scorer** to recommend patterns for your applications.
+
+### Quick Start
+
+1. **Clone the Repository** (sidebar) - Get the Azure Architecture Center content
+2. **Generate Catalog** (tab 1) - Build `architecture-catalog.json` with defaults (~170 architectures)
+
+**Optional customization:**
+- **Preview** - See what will be included before generating
+- **Adjust Filters** (tab 2) - Customize which architectures to include
+
+### Default Settings
+
+The builder uses sensible defaults that work for most use cases:
+
+| Setting | Default | Effect |
+|---------|---------|--------|
+| **Topic Filter** | reference-architecture, example-scenario, solution-idea | All topic types |
+| **Exclude Examples** | No | All ~170 architectures (curated + examples) |
+| **Product Filter** | None (all) | No product restrictions |
+| **Category Filter** | None (all) | No category restrictions |
+| **Require YML** | No | Includes both YML-tagged and detected architectures |
+
+**Note:** Example scenarios (marked `example_only`) are learning/POC architectures, not
+production-ready patterns. Check "Exclude Examples" in Filters for production catalogs only.
+
+### Workflow
+
+```
+Repository → Detection → Filtering → Classification → Catalog JSON
+```
+
+1. **Detection**: Identifies architecture documents by folder, metadata, and content signals
+2. **Filtering**: Applies your topic/product/category filters
+3. **Classification**: Assigns workload domain, family, runtime model, etc.
+4. **Output**: Generates `architecture-catalog.json` for the scorer
+
+### CLI Usage
+
+After configuring, use the CLI to build the full catalog:
+```bash
+catalog-builder build-catalog --repo-path ./architecture-center --out catalog.json --config my-config.yaml
+```
+"""
+
+
+def _run_git(
+    cmd: list[str],
+    timeout: float,
+    cwd: Optional[str] = None,
+    progress_callback: Optional[Callable[[str], None]] = None
+) -> subprocess.CompletedProcess:
+    """Run a git command, streaming its stderr lines to progress_callback.
+
+    Like subprocess.run(..., capture_output=True, text=True), but git's
+    progress output is passed on as it arrives instead of after exit.
+    Only the last lines of stderr are kept for error messages.
+    """
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    tail = deque(maxlen=20)
+    try:
+        # Text mode splits on the \r git uses to redraw progress lines
+        for line in proc.stderr:
+            line = line.strip()
+            if line:
+                tail.append(line)
+                if progress_callback:
+                    progress_callback(line)
+        proc.wait()
+    finally:
+        timed_out = timer.finished.is_set()
+        timer.cancel()
+        proc.stderr.close()
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, '', '\n'.join(tail))
+
+
+def clone_repository(
+    repo_url: str,
+    clone_dir: str,
+    progress_callback: Optional[Callable[[str], None]] = None
+) -> tuple[bool, str]:
     """Clone the repository to the specified directory.
 
     Args:
         repo_url: Git URL to clone from.
         clone_dir: User-provided directory path to clone into.
+        progress_callback: Optional callback for git progress lines.
 
     Returns:
         Tuple of (success, message).
@@ -48,21 +149,25 @@ def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
     # Check if directory already exists with a valid repo
     if clone_path.exists():
         if (clone_path / '.git').exists() and (clone_path / 'docs').exists():
-            # Try to pull latest
+            # Fetch just the upstream tip rather than pull (fetch + merge).
+            # Shallow clones stay shallow, and --keep refuses to overwrite
+            # local edits instead of discarding them.
+            fetch_cmd = ['git', 'fetch', '--progress', 'origin', 'HEAD']
+            if (clone_path / '.git' / 'shallow').exists():
+                fetch_cmd.insert(2, '--depth=1')
             try:
-                result = subprocess.run(
-                    ['git', 'pull'],
-                    cwd=str(clone_path),
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                if result.returncode == 0:
-                    return True, "Repository updated (git pull)"
-                else:
-                    return False, f"Git pull failed: {result.stderr}"
+                for cmd in (fetch_cmd, ['git', 'reset', '--keep', 'FETCH_HEAD']):
+                    result = _run_git(
+                        cmd,
+                        cwd=str(clone_path),
+                        timeout=120,
+                        progress_callback=progress_callback
+                    )
+                    if result.returncode != 0:
+                        return False, f"Git update failed: {result.stderr}"
+                return True, "Repository updated (git fetch)"
             except subprocess.TimeoutExpired:
-                return False, "Git pull timed out"
+                return False, "Git update timed out"
             except Exception as e:
                 return False, f"Error updating repo: {e}"
         else:
@@ -73,12 +178,22 @@ def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
 
     # Clone the repository
     try:
-        result = subprocess.run(
-            ['git', 'clone', '--depth', '1', repo_url, str(clone_path)],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout for clone
+        # Blobless clone: full commit history (so per-file last-modified
+        # dates are real) while file contents download only for the checkout
+        result = _run_git(
+            ['git', 'clone', '--progress', '--filter=blob:none', '--sparse',
+             repo_url, str(clone_path)],
+            timeout=300,  # 5 minute timeout for clone
+            progress_callback=progress_callback
         )
+        if result.returncode == 0:
+            # The catalog builder only reads docs/, so only check that out
+            result = _run_git(
+                ['git', 'sparse-checkout', 'set', 'docs'],
+                cwd=str(clone_path),
+                timeout=300,
+                progress_callback=progress_callback
+            )
         if result.returncode == 0:
             return True, "Repository cloned successfully"
         else:
@@ -91,6 +206,61 @@ def clone_repository(repo_url: str, clone_dir: str) -> tuple[bool, str]:
         return False, f"Error cloning repo: {e}"
 
 
+@st.cache_data(ttl=300)
+def _count_docs(repo_path: str, docs_mtime: float) -> int:
+    """Count markdown docs in the repo, cached per path and docs/ mtime."""
+    # os.scandir avoids building a Path per entry the way rglob does
+    count = 0
+    stack = [os.path.join(repo_path, 'docs')]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md'):
+                    count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return count
+
+
+def _start_repo_job(repo_url: str, clone_dir: str) -> None:
+    """Run clone_repository in a background thread so reruns aren't blocked."""
+    executor = get_state('repo_job_executor')
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        set_state('repo_job_executor', executor)
+    # Latest git progress line; written by the worker, read on each rerun
+    progress = deque(maxlen=1)
+    future = executor.submit(clone_repository, repo_url, clone_dir, progress.append)
+    set_state('repo_job', (future, clone_dir, progress))
+
+
+def _finish_repo_job() -> bool:
+    """Apply the result of a finished clone/update.
+
+    Returns True while a clone/update is still running.
+    """
+    job = get_state('repo_job')
+    if job is None:
+        return False
+
+    future, clone_dir, _ = job
+    if not future.done():
+        return True
+
+    set_state('repo_job', None)
+    success, message = future.result()
+    if success:
+        _count_docs.clear()
+        # Resolve symlinks for consistent paths using validated path
+        try:
+            validated_path = safe_path(clone_dir, must_exist=True)
+            set_state('repo_path', str(validated_path))
+        except PathValidationError:
+            set_state('repo_path', '')
+    set_state('repo_job_message', (success, message))
+    return False
+
+
 def render_sidebar() -> None:
     """Render the sidebar with common controls."""
     st.sidebar.title("Catalog Builder")
@@ -99,12 +269,33 @@ def render_sidebar() -> None:
     # Repository section
     st.sidebar.subheader("Repository")
 
+    repo_job_running = _finish_repo_job()
+    if repo_job_running:
+        st.sidebar.info("⏳ Cloning/updating repository in the background...")
+        progress = get_state('repo_job')[2]
+        if progress:
+            st.sidebar.caption(progress[-1])
+    job_message = get_state('repo_job_message')
+    if job_message:
+        set_state('repo_job_message', None)
+        success, message = job_message
+        if success:
+            st.sidebar.success(message)
+        else:
+            st.sidebar.error(message)
+
     repo_path = get_state('repo_path', '')
+    saved_repo_url = get_state('repo_url', DEFAULT_REPO_URL)
+    saved_clone_dir = get_state('clone_dir', DEFAULT_CLONE_DIR)
     repo_valid = False
 
     if repo_path:
-        repo = Path(repo_path)
-        repo_valid = repo.exists() and (repo / 'docs').exists()
+        # One stat both validates the repo and keys the doc count cache
+        try:
+            docs_mtime = (Path(repo_path) / 'docs').stat().st_mtime
+            repo_valid = True
+        except (OSError, ValueError):
+            pass
 
     # Show prominent warning if no repo found
     if not repo_path or not repo_valid:
@@ -114,71 +305,62 @@ def render_sidebar() -> None:
         # Clone section (expanded when no repo)
         repo_url = st.sidebar.text_input(
             "Repository URL",
-            value=get_state('repo_url', DEFAULT_REPO_URL),
+            value=saved_repo_url,
             help="Git URL for the Azure Architecture Center repository"
         )
-        set_state('repo_url', repo_url)
+        if repo_url != saved_repo_url:
+            set_state('repo_url', repo_url)
 
         clone_dir = st.sidebar.text_input(
             "Clone Directory",
-            value=get_state('clone_dir', DEFAULT_CLONE_DIR),
+            value=saved_clone_dir,
             help="Where to clone the architecture-center repo (NOT this project's directory)"
         )
-        set_state('clone_dir', clone_dir)
-
-        if st.sidebar.button("Clone Repository", type="primary", use_container_width=True):
-            with st.spinner("Cloning repository (this may take a few minutes)..."):
-                success, message = clone_repository(repo_url, clone_dir)
-                if success:
-                    st.sidebar.success(message)
-                    # Resolve symlinks for consistent paths using validated path
-                    try:
-                        validated_path = safe_path(clone_dir, must_exist=True)
-                        set_state('repo_path', str(validated_path))
-                    except PathValidationError:
-                        set_state('repo_path', '')
-                    st.rerun()
-                else:
-                    st.sidebar.error(message)
+        if clone_dir != saved_clone_dir:
+            set_state('clone_dir', clone_dir)
+
+        if st.sidebar.button(
+            "Clone Repository",
+            type="primary",
+            use_container_width=True,
+            disabled=repo_job_running
+        ):
+            _start_repo_job(repo_url, clone_dir)
+            st.rerun()
 
         st.sidebar.markdown("---")
         st.sidebar.markdown("**Or specify an existing path:**")
 
     else:
         # Repo found - show success and collapse clone options
-        doc_count = len(list((Path(repo_path) / 'docs').rglob('*.md')))
+        doc_count = _count_docs(repo_path, docs_mtime)
         st.sidebar.success(f"✓ Repository found ({doc_count:,} docs)")
 
         # Clone/update in expander when repo exists
         with st.sidebar.expander("Update or Change Repository"):
             repo_url = st.text_input(
                 "Repository URL",
-                value=get_state('repo_url', DEFAULT_REPO_URL),
+                value=saved_repo_url,
                 help="Git URL for the Azure Architecture Center repository"
             )
-            set_state('repo_url', repo_url)
+            if repo_url != saved_repo_url:
+                set_state('repo_url', repo_url)
 
             clone_dir = st.text_input(
                 "Clone Directory",
-                value=get_state('clone_dir', DEFAULT_CLONE_DIR),
+                value=saved_clone_dir,
                 help="Where to clone the architecture-center repo (NOT this project's directory)"
             )
-            set_state('clone_dir', clone_dir)
+            if clone_dir != saved_clone_dir:
+                set_state('clone_dir', clone_dir)
 
-            if st.button("Update Repository (git pull)", use_container_width=True):
-                with st.spinner("Updating repository..."):
-                    success, message = clone_repository(repo_url, clone_dir)
-                    if success:
-                        st.success(message)
-                        # Resolve symlinks for consistent paths using validated path
-                        try:
-                            validated_path = safe_path(clone_dir, must_exist=True)
-                            set_state('repo_path', str(validated_path))
-                        except PathValidationError:
-                            set_state('repo_path', '')
-                        st.rerun()
-                    else:
-                        st.error(message)
+            if st.button(
+                "Update Repository (git fetch)",
+                use_container_width=True,
+                disabled=repo_job_running
+            ):
+                _start_repo_job(repo_url, clone_dir)
+                st.rerun()
 
     # Repository path input (can be set manually or via clone)
     new_repo_path = st.sidebar.text_input(
@@ -205,7 +387,9 @@ def render_sidebar() -> None:
         import yaml
         from catalog_builder.config import CatalogConfig
         try:
-            data = yaml.safe_load(uploaded_file.read())
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            data = yaml.load(uploaded_file, Loader=loader)
             config = CatalogConfig.model_validate(data)
             set_state('config', config)
             st.sidebar.success("Config loaded!")
@@ -241,80 +425,31 @@ def main() -> None:
 
     # Welcome/Overview section
     with st.expander("📖 Getting Started", expanded=not get_state('repo_path')):
-        st.markdown("""
-        ### What This Tool Does
-
-        The Catalog Builder scans the [Azure Architecture Center](https://learn.microsoft.com/en-us/azure/architecture/)
-        repository and creates a structured catalog of architecture patterns. This catalog is used by the
-        **Architecture Scorer** to recommend patterns for your applications.
-
-        ### Quick Start
-
-        1. **Clone the Repository** (sidebar) - Get the Azure Architecture Center content
-        2. **Generate Catalog** (tab 1) - Build `architecture-catalog.json` with defaults (~170 architectures)
-
-        **Optional customization:**
-        - **Preview** - See what will be included before generating
-        - **Adjust Filters** (tab 2) - Customize which architectures to include
-
-        ### Default Settings
-
-        The builder uses sensible defaults that work for most use cases:
-
-        | Setting | Default | Effect |
-        |---------|---------|--------|
-        | **Topic Filter** | reference-architecture, example-scenario, solution-idea | All topic types |
-        | **Exclude Examples** | No | All ~170 architectures (curated + examples) |
-        | **Product Filter** | None (all) | No product restrictions |
-        | **Category Filter** | None (all) | No category restrictions |
-        | **Require YML** | No | Includes both YML-tagged and detected architectures |
-
-        **Note:** Example scenarios (marked `example_only`) are learning/POC architectures, not
-        production-ready patterns. Check "Exclude Examples" in Filters for production catalogs only.
-
-        ### Workflow
-
-        ```
-        Repository → Detection → Filtering → Classification → Catalog JSON
-        ```
-
-        1. **Detection**: Identifies architecture documents by folder, metadata, and content signals
-        2. **Filtering**: Applies your topic/product/category filters
-        3. **Classification**: Assigns workload domain, family, runtime model, etc.
-        4. **Output**: Generates `architecture-catalog.json` for the scorer
-
-        ### CLI Usage
-
-        After configuring, use the CLI to build the full catalog:
-        ```bash
-        catalog-builder build-catalog --repo-path ./architecture-center --out catalog.json --config my-config.yaml
-        ```
-        """)
-
-    st.markdown("Configure the catalog builder settings through the tabs below.")
-
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🔨 Build Catalog",
-        "🎛️ Filter Presets",
-        "📚 Keyword Dictionaries",
-        "⚙️ Config Editor",
-        "🔄 Modernization Options"
-    ])
-
-    with tab1:
-        render_preview_panel()
-
-    with tab2:
-        render_filter_presets()
-
-    with tab3:
-        render_keywords_editor()
-
-    with tab4:
-        render_config_editor()
+        st.markdown(GETTING_STARTED_MD)
+
+    st.markdown("Configure the catalog builder settings through the sections below.")
+
+    # Only the selected section's renderer runs on each rerun
+    sections = {
+        "🔨 Build Catalog": render_preview_panel,
+        "🎛️ Filter Presets": render_filter_presets,
+        "📚 Keyword Dictionaries": render_keywords_editor,
+        "⚙️ Config Editor": render_config_editor,
+        "🔄 Modernization Options": render_modernization_editor,
+    }
+    active_tab = st.radio(
+        "Section",
+        list(sections),
+        key='active_tab',
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    sections[active_tab]()
 
-    with tab5:
-        render_modernization_editor()
+    # Poll a background clone/update; the page stays usable in between
+    if get_state('repo_job') is not None:
+        time.sleep(REPO_JOB_POLL_INTERVAL)
+        st.rerun()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Config editor component for visual YAML configuration editing."""
 
+import json
+
 import yaml
 
 import streamlit as st
@@ -8,6 +10,27 @@ from catalog_builder.config import CatalogConfig
 from catalog_builder_gui.state import get_state, set_state
 from architecture_recommendations_app.utils.sanitize import validate_output_path
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _YamlSafeDumper, CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlSafeDumper, SafeLoader as _YamlSafeLoader
+
+# Defaults never change within a session, so dump them once for diffing
+_DEFAULT_CONFIG_DICT = CatalogConfig().model_dump(mode='json')
+
+# Option lists for the filter multiselects
+ALL_TOPICS = (
+    'reference-architecture', 'example-scenario', 'solution-idea',
+    'concept-article', 'best-practice', 'include', 'hub-page'
+)
+ALL_CATEGORIES = (
+    'web', 'ai-machine-learning', 'analytics', 'compute', 'containers',
+    'databases', 'devops', 'hybrid', 'identity', 'integration', 'iot',
+    'management-and-governance', 'media', 'migration', 'networking',
+    'security', 'storage', 'developer-tools'
+)
+
 
 def render_config_editor() -> None:
     """Render the config editor tab."""
@@ -138,27 +161,17 @@ def _render_form_editor(config: CatalogConfig) -> None:
         filters = config.filters
 
         st.markdown("**Topic Filters:**")
-        all_topics = [
-            'reference-architecture', 'example-scenario', 'solution-idea',
-            'concept-article', 'best-practice', 'include', 'hub-page'
-        ]
         filters.allowed_topics = st.multiselect(
             "Allowed Topics",
-            options=all_topics,
+            options=ALL_TOPICS,
             default=filters.allowed_topics,
             help="Only include documents with these ms.topic values"
         )
 
         st.markdown("**Category Filters:**")
-        all_categories = [
-            'web', 'ai-machine-learning', 'analytics', 'compute', 'containers',
-            'databases', 'devops', 'hybrid', 'identity', 'integration', 'iot',
-            'management-and-governance', 'media', 'migration', 'networking',
-            'security', 'storage', 'developer-tools'
-        ]
         filters.allowed_categories = st.multiselect(
             "Allowed Categories",
-            options=all_categories,
+            options=ALL_CATEGORIES,
             default=filters.allowed_categories,
             help="Only include documents with these categories (empty = all)"
         )
@@ -249,16 +262,9 @@ def _render_yaml_editor(config: CatalogConfig) -> None:
     # Show diff from defaults option
     show_diff = st.checkbox("Show Only Changes from Defaults", value=False)
 
-    # Generate YAML
-    if show_diff:
-        yaml_content = _get_diff_yaml(config)
-    else:
-        yaml_content = yaml.dump(
-            config.model_dump(),
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True
-        )
+    # Generate YAML (cached on the config's JSON, so reruns that leave the
+    # config unchanged skip the dump)
+    yaml_content = _config_yaml(config.model_dump_json(), show_diff)
 
     # Editable YAML
     edited_yaml = st.text_area(
@@ -274,7 +280,7 @@ def _render_yaml_editor(config: CatalogConfig) -> None:
     with col1:
         if st.button("Validate YAML"):
             try:
-                data = yaml.safe_load(edited_yaml)
+                data = yaml.load(edited_yaml, Loader=_YamlSafeLoader)
                 CatalogConfig.model_validate(data)
                 st.success("YAML is valid!")
             except yaml.YAMLError as e:
@@ -285,7 +291,7 @@ def _render_yaml_editor(config: CatalogConfig) -> None:
     with col2:
         if st.button("Apply YAML Changes"):
             try:
-                data = yaml.safe_load(edited_yaml)
+                data = yaml.load(edited_yaml, Loader=_YamlSafeLoader)
                 new_config = CatalogConfig.model_validate(data)
                 set_state('config', new_config)
                 st.success("Configuration applied!")
@@ -325,19 +331,22 @@ def _render_yaml_editor(config: CatalogConfig) -> None:
                 st.error(f"Error saving file: {e}")
 
 
-def _get_diff_yaml(config: CatalogConfig) -> str:
-    """Get YAML containing only values that differ from defaults."""
-    default_config = CatalogConfig()
-    current_dict = config.model_dump()
-    default_dict = default_config.model_dump()
+@st.cache_data(ttl=3600)
+def _config_yaml(config_json: str, diff_only: bool) -> str:
+    """Render a config as YAML, optionally only values that differ from defaults.
 
-    diff_dict = _recursive_diff(current_dict, default_dict)
+    Takes the config as JSON so Streamlit can hash it for caching.
+    """
+    config_dict = json.loads(config_json)
 
-    if not diff_dict:
-        return "# No changes from defaults"
+    if diff_only:
+        config_dict = _recursive_diff(config_dict, _DEFAULT_CONFIG_DICT)
+        if not config_dict:
+            return "# No changes from defaults"
 
     return yaml.dump(
-        diff_dict,
+        config_dict,
+        Dumper=_YamlSafeDumper,
         default_flow_style=False,
         sort_keys=False,
         allow_unicode=True
@@ -351,11 +360,15 @@ def _recursive_diff(current: dict, default: dict) -> dict:
     for key, value in current.items():
         default_value = default.get(key)
 
+        # Unchanged subtrees compare equal in C; skip recursing into them
+        if value is default_value or value == default_value:
+            continue
+
         if isinstance(value, dict) and isinstance(default_value, dict):
             nested_diff = _recursive_diff(value, default_value)
             if nested_diff:
                 diff[key] = nested_diff
-        elif value != default_value:
+        else:
             diff[key] = value
 
     return diff
@@ -11,6 +11,20 @@ from architecture_recommendations_app.utils.sanitize import (
     safe_path, validate_repo_path, validate_output_path, PathValidationError
 )
 
+# Parsed documents shared across preview scans in this process. Entries are
+# validated against file mtime/size, so re-running a scan only re-parses
+# files that changed since the previous run.
+_preview_parse_cache = None
+
+
+def _get_preview_parse_cache():
+    """Get the process-wide in-memory parse cache for preview scans."""
+    global _preview_parse_cache
+    if _preview_parse_cache is None:
+        from catalog_builder.parser import ParseCache
+        _preview_parse_cache = ParseCache()
+    return _preview_parse_cache
+
 
 def _get_default_output_path() -> str:
     """Get the default output path for the catalog (project root)."""
@@ -293,7 +307,7 @@ def _run_preview_scan(repo_path: Path, max_files: int) -> None:
         status_text = st.empty()
 
         try:
-            parser = MarkdownParser()
+            parser = MarkdownParser(cache=_get_preview_parse_cache())
             detector = ArchitectureDetector()
 
             # Find markdown files - prioritize architecture folders
@@ -531,7 +545,6 @@ def _display_results(
 
 def _generate_catalog(repo_path: str, output_path: str) -> None:
     """Generate the full catalog and display results."""
-    import json
     from catalog_builder.catalog import CatalogBuilder
     from catalog_builder.schema import GenerationSettings
 
@@ -581,9 +594,7 @@ def _generate_catalog(repo_path: str, output_path: str) -> None:
             progress_bar.progress(80)
 
             # Write to file using validated path
-            catalog_dict = catalog.model_dump(mode='json')
-            with open(validated_output, 'w', encoding='utf-8') as f:
-                json.dump(catalog_dict, f, indent=2, default=str)
+            builder.save_catalog(catalog, validated_output)
 
             progress_bar.progress(100)
             status_text.empty()
@@ -623,7 +634,7 @@ def _generate_catalog(repo_path: str, output_path: str) -> None:
             # Download button
             st.download_button(
                 "Download Catalog JSON",
-                data=json.dumps(catalog_dict, indent=2, default=str),
+                data=catalog.model_dump_json(indent=2),
                 file_name="architecture-catalog.json",
                 mime="application/json",
                 use_container_width=True
@@ -930,6 +930,23 @@ class TestEdgeCases:
             result = scoring_engine.score(str(context_file), max_recommendations=max_rec)
             assert len(result.recommendations) <= max_rec
 
+    def test_unsupported_catalog_version_rejected(self, tmp_path: Path):
+        """Old catalogs should be reported by version, not by schema errors."""
+        catalog_file = tmp_path / "catalog.json"
+        catalog_file.write_text(json.dumps({
+            "version": "0.9.0",
+            "source_repo": "repo",
+            "architectures": [{"architecture_id": "legacy"}],
+        }))
+
+        with pytest.raises(ValueError, match="version 0.9.0 is not compatible"):
+            ScoringEngine().load_catalog(str(catalog_file))
+
+        catalog_file.write_text(json.dumps({"version": "1.0.0", "source_repo": "repo"}))
+        engine = ScoringEngine()
+        engine.load_catalog(str(catalog_file))
+        assert engine.catalog.architectures == []
+
 
 class TestScoringConsistency:
     """Tests for scoring consistency and determinism."""
@@ -1,12 +1,13 @@
 """Tests for the catalog builder."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from catalog_builder.parser import MarkdownParser, ParsedDocument, ArchitectureMetadata
+from catalog_builder.parser import MarkdownParser, ParseCache, ParsedDocument, ArchitectureMetadata
 from catalog_builder.detector import ArchitectureDetector, DetectionResult
 from catalog_builder.extractor import MetadataExtractor
 from catalog_builder.classifier import ArchitectureClassifier
@@ -49,6 +50,16 @@ This is the content.
         assert doc.description == "A test architecture description"
         assert doc.frontmatter.get("ms.topic") == "architecture"
 
+    def test_frontmatter_dates_stay_strings(self):
+        """Test dates are left as strings while booleans are still resolved."""
+        parser = MarkdownParser()
+        content = "---\ntitle: Hub\nms.date: 2024-05-01\nis_hub_page: false\n---\n\n# Hub\n"
+
+        doc = parser.parse_content(content, Path("test.md"))
+
+        assert doc.frontmatter["ms.date"] == "2024-05-01"
+        assert doc.frontmatter["is_hub_page"] is False
+
     def test_parse_headings(self):
         """Test extracting headings."""
         parser = MarkdownParser()
@@ -74,6 +85,28 @@ Details.
         assert (2, "Components") in doc.headings
         assert (3, "Sub Component") in doc.headings
 
+    def test_headings_do_not_span_lines(self):
+        """Test a bare '#' line does not swallow the following line."""
+        parser = MarkdownParser()
+        content = "#  \nNot a heading\n\n## Real\n\nBody.\n"
+
+        doc = parser.parse_content(content, Path("test.md"))
+
+        assert (1, "Not a heading") not in doc.headings
+        assert (2, "Real") in doc.headings
+        assert doc.sections == {"real": "Body."}
+
+    def test_heading_anchors_stripped(self):
+        """Test a trailing {#anchor} is not part of the heading text."""
+        parser = MarkdownParser()
+        content = "# Main Title {#main}\n\n## Overview  {#overview-1}  \n\nBody.\n"
+
+        doc = parser.parse_content(content, Path("test.md"))
+
+        assert doc.title == "Main Title"
+        assert doc.headings == [(1, "Main Title"), (2, "Overview")]
+        assert doc.sections["overview"] == "Body."
+
     def test_parse_images(self):
         """Test extracting images."""
         parser = MarkdownParser()
@@ -88,6 +121,160 @@ Details.
         assert "./images/architecture.svg" in doc.images
         assert "./diagrams/flow.png" in doc.images
 
+    def test_linked_image_counts_as_image_and_link(self):
+        """Test an image wrapped in a link is found by both scans."""
+        parser = MarkdownParser()
+        content = "[![Deploy to Azure](https://aka.ms/deploybutton)](https://portal.azure.com)\n"
+
+        doc = parser.parse_content(content, Path("test.md"))
+
+        assert doc.images == ["https://aka.ms/deploybutton"]
+        assert doc.links == ["https://aka.ms/deploybutton"]
+        assert parser.parse_content("No markup here.", Path("test.md")).links == []
+
+    def test_parse_file_normalizes_newlines(self, tmp_path):
+        """Test parse_file treats CRLF files like text-mode reads."""
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes(b"---\r\ntitle: CRLF Doc\r\n---\r\n\r\n# Heading\r\n\r\nBody.\r\n")
+
+        doc = MarkdownParser().parse_file(md_file)
+
+        assert doc.raw_content == md_file.read_text(encoding="utf-8")
+        assert doc.title == "CRLF Doc"
+        assert doc.headings == [(1, "Heading")]
+
+    def test_parse_yml_file(self, tmp_path):
+        """Test a YamlMime:Architecture file is parsed with its included content."""
+        (tmp_path / "web-app-content.md").write_text(
+            "# Web App\n\n![Diagram](./images/web-app.svg)\n", encoding="utf-8"
+        )
+        yml_file = tmp_path / "web-app.yml"
+        yml_file.write_text(
+            "### YamlMime:Architecture\n"
+            "metadata:\n"
+            "  title: Web app\n"
+            "  ms.topic: reference-architecture\n"
+            "name: Baseline web app\n"
+            "summary: A web app baseline.\n"
+            "azureCategories:\n"
+            "  - web\n"
+            "products:\n"
+            "  - azure-app-service\n"
+            "content: |\n"
+            "  [!include[](web-app-content.md)]\n",
+            encoding="utf-8",
+        )
+
+        doc = MarkdownParser().parse_yml_file(yml_file)
+
+        assert doc.title == "Baseline web app"
+        assert doc.description == "A web app baseline."
+        assert doc.arch_metadata.ms_topic == "reference-architecture"
+        assert doc.arch_metadata.products == ["azure-app-service"]
+        assert doc.images == ["./images/web-app.svg"]
+        assert doc.raw_content.startswith("### YamlMime:Architecture")
+
+    def test_yml_categories_keep_source_order(self, tmp_path):
+        """Test azure categories are deduplicated without reordering."""
+        yml_file = tmp_path / "app.yml"
+        yml_file.write_text(
+            "### YamlMime:Architecture\n"
+            "metadata:\n"
+            "  ms.category:\n"
+            "    - web\n"
+            "    - databases\n"
+            "azureCategories:\n"
+            "  - iot\n"
+            "  - web\n",
+            encoding="utf-8",
+        )
+
+        metadata = MarkdownParser()._parse_architecture_yml(yml_file)
+
+        assert metadata.azure_categories == ["iot", "web", "databases"]
+
+    def test_header_only_yml_is_ignored(self, tmp_path):
+        """Test a YamlMime header with no body yields no metadata."""
+        parser = MarkdownParser()
+        for i, text in enumerate(["### YamlMime:Architecture", "### YamlMime:Architecture\n"]):
+            yml_file = tmp_path / f"empty{i}.yml"
+            yml_file.write_text(text, encoding="utf-8")
+
+            assert parser._parse_architecture_yml(yml_file) is None
+            assert parser.parse_yml_file(yml_file) is None
+
+    def test_parse_file_finds_paired_yml(self, tmp_path):
+        """Test .yml pairing for -content and index.md layouts."""
+        yml = "### YamlMime:Architecture\nmetadata:\n  ms.topic: {topic}\n"
+        (tmp_path / "web-app.yml").write_text(yml.format(topic="example-scenario"), encoding="utf-8")
+        (tmp_path / "web-app-content.md").write_text("# Web App\n", encoding="utf-8")
+        (tmp_path / "aks.yml").write_text(yml.format(topic="reference-architecture"), encoding="utf-8")
+        (tmp_path / "aks").mkdir()
+        (tmp_path / "aks" / "index.md").write_text("# AKS\n", encoding="utf-8")
+        (tmp_path / "plain.md").write_text("# Plain\n", encoding="utf-8")
+
+        parser = MarkdownParser()
+
+        assert parser.parse_file(tmp_path / "web-app-content.md").frontmatter['ms.topic'] == "example-scenario"
+        assert parser.parse_file(tmp_path / "aks" / "index.md").frontmatter['ms.topic'] == "reference-architecture"
+        assert not parser.parse_file(tmp_path / "plain.md").arch_metadata.is_architecture_yml
+
+    def test_parse_file_metadata_only(self, tmp_path):
+        """Test metadata_only reads frontmatter without parsing the body."""
+        body = "## Architecture\n\n![Diagram](./arch.svg)\n" + "Filler text.\n" * 2000
+        md_file = tmp_path / "big.md"
+        md_file.write_text(
+            "---\ntitle: Big Doc\ndescription: Large file.\nms.topic: architecture\n---\n\n" + body,
+            encoding="utf-8",
+        )
+        untitled = tmp_path / "untitled.md"
+        untitled.write_text("---\nms.topic: guide\n---\n\n# Heading Title\n\n" + body, encoding="utf-8")
+
+        parser = MarkdownParser()
+        doc = parser.parse_file(md_file, metadata_only=True)
+
+        assert doc.title == "Big Doc"
+        assert doc.description == "Large file."
+        assert doc.arch_metadata.ms_topic == "architecture"
+        assert doc.content == ""
+        assert doc.images == []
+        # Without a frontmatter title the full document is parsed
+        assert parser.parse_file(untitled, metadata_only=True).title == "Heading Title"
+
+    def test_parse_many_matches_parse_file(self, tmp_path):
+        """Test parse_many returns the same documents as parse_file, in order."""
+        paths = []
+        for i in range(3):
+            md_file = tmp_path / f"doc{i}.md"
+            md_file.write_text(f"---\ntitle: Doc {i}\n---\n\n## Section {i}\n", encoding="utf-8")
+            paths.append(md_file)
+        paths.append(tmp_path / "missing.md")
+
+        docs = MarkdownParser().parse_many(paths, workers=2)
+
+        assert [d.title if d else None for d in docs] == ["Doc 0", "Doc 1", "Doc 2", None]
+        assert docs[1].headings == MarkdownParser().parse_file(paths[1]).headings
+
+    def test_sections_are_lazy(self):
+        """Test sections, images and links are only built when first read."""
+        parser = MarkdownParser()
+        content = """# Main Title
+
+## Considerations
+
+Requires Kubernetes experience.
+"""
+        doc = parser.parse_content(content, Path("test.md"))
+
+        assert doc._sections is None
+        assert doc._headings is None
+        assert doc.sections["considerations"] == "Requires Kubernetes experience."
+        # One scan fills in both
+        assert doc._headings == [(1, "Main Title"), (2, "Considerations")]
+        assert doc._images is None
+        assert doc._links is None
+        assert doc.links == []
+
     def test_extract_azure_services(self):
         """Test Azure service extraction."""
         parser = MarkdownParser()
@@ -105,6 +292,91 @@ compute and Azure API Management for the API gateway.
         assert "Azure Functions" in services
         assert "Azure API Management" in services
 
+    def test_detection_patterns_follow_config_changes(self):
+        """Test compiled detection patterns are rebuilt when config changes."""
+        from catalog_builder.config import get_config, reset_config
+
+        parser = MarkdownParser()
+        doc = parser.parse_content("Remote access goes through Azure Bastion.", Path("test.md"))
+        assert "Azure Bastion" in parser.extract_azure_services(doc)
+
+        try:
+            get_config().services.detection_patterns = [r'(Key\s+Vault)']
+            assert parser.extract_azure_services(doc) == []
+        finally:
+            reset_config()
+
+    def test_service_matches_follow_normalization_changes(self):
+        """Test remembered service matches are dropped when normalizations change."""
+        from catalog_builder.config import get_config, reset_config
+
+        parser = MarkdownParser()
+        doc = parser.parse_content("Secrets live in the Vault Store.", Path("test.md"))
+
+        try:
+            get_config().services.detection_patterns = [r'(Vault\s+Store)']
+            assert parser.extract_azure_services(doc) == []
+            get_config().services.normalizations["vault store"] = "Azure Key Vault"
+            assert parser.extract_azure_services(doc) == ["Azure Key Vault"]
+        finally:
+            reset_config()
+
+
+    def test_scan_known_services(self):
+        """Test the single-pass scan for full known service names."""
+        from catalog_builder.config import get_config, reset_config
+
+        parser = MarkdownParser()
+        doc = parser.parse_content(
+            "Users sign in with Azure Active Directory B2C, then call\n"
+            "Azure  App Service which stores data in Cosmos DB.",
+            Path("test.md"),
+        )
+
+        try:
+            get_config().services.scan_known_services = True
+            services = parser.extract_azure_services(doc)
+        finally:
+            reset_config()
+
+        assert services == ["Azure Active Directory B2C", "Azure App Service"]
+        assert parser.find_known_services("Azure\nFunctions and Azure Batch") == {
+            "Azure Functions", "Azure Batch"
+        }
+
+
+class TestParseCache:
+    """Tests for the persistent parse cache."""
+
+    def test_unchanged_file_served_from_cache(self, tmp_path):
+        """Test a saved cache is reused until the file changes."""
+        md_file = tmp_path / "doc.md"
+        md_file.write_text("---\ntitle: First\n---\n\n# First\n", encoding="utf-8")
+        cache_file = tmp_path / "parse-cache.pkl"
+
+        cache = ParseCache(cache_file)
+        MarkdownParser(cache=cache).parse_file(md_file)
+        cache.save()
+
+        reloaded = ParseCache(cache_file)
+        stat = md_file.stat()
+        parser = MarkdownParser(cache=reloaded)
+        assert reloaded.get(md_file, parser._file_signature(md_file)) is not None
+        assert parser.parse_file(md_file).title == "First"
+
+        md_file.write_text("---\ntitle: Second title\n---\n", encoding="utf-8")
+        os.utime(md_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert parser.parse_file(md_file).title == "Second title"
+
+    def test_incompatible_cache_file_ignored(self, tmp_path):
+        """Test a corrupt cache file starts an empty cache."""
+        cache_file = tmp_path / "parse-cache.pkl"
+        cache_file.write_bytes(b"not a pickle")
+
+        cache = ParseCache(cache_file)
+
+        assert cache.get(tmp_path / "doc.md", (0, 0, ())) is None
+
 
 class TestArchitectureDetector:
     """Tests for architecture detection."""
@@ -195,6 +467,23 @@ class TestMetadataExtractor:
         url2 = extractor._build_learn_url("docs/networking/architecture/azure-dns-private-resolver-content.md")
         assert url2 == "https://learn.microsoft.com/en-us/azure/architecture/networking/architecture/azure-dns-private-resolver"
 
+    def test_extract_diagrams_deduplicates(self):
+        """Test repeated image references yield one diagram asset each."""
+        parser = MarkdownParser()
+        extractor = MetadataExtractor(parser)
+        content = """# Test
+
+![Architecture](./images/architecture.svg)
+:::image type="content" source="./images/architecture.svg" alt-text="Architecture":::
+![Flow](images/flow.png)
+![Logo](https://example.com/architecture.png)
+"""
+        doc = parser.parse_content(content, Path("docs/web/app.md"))
+
+        diagrams = extractor._extract_diagrams(doc, "docs/web/app.md")
+
+        assert diagrams == ["docs/web/images/architecture.svg", "docs/web/images/flow.png"]
+
 
 class TestArchitectureClassifier:
     """Tests for the classifier."""
@@ -253,6 +542,28 @@ class TestCatalogSchema:
         assert entry.expected_runtime_models == [RuntimeModel.UNKNOWN]
         assert entry.azure_services_used == []
 
+    def test_nested_defaults_are_shared_and_frozen(self):
+        """Test nested model defaults are shared, immutable instances."""
+        from pydantic import ValidationError
+        from catalog_builder.schema import ExtractionConfidence
+
+        first = ArchitectureEntry(
+            architecture_id="a", name="A", description="", source_repo_path="a.md"
+        )
+        second = ArchitectureEntry(
+            architecture_id="b", name="B", description="", source_repo_path="b.md"
+        )
+
+        assert first.family_confidence is second.family_confidence
+        assert first.complexity is second.complexity
+        assert first.expected_characteristics is second.expected_characteristics
+        assert first.family_confidence.confidence == ExtractionConfidence.MANUAL_REQUIRED
+        assert first.treatments_confidence.confidence == ExtractionConfidence.AI_SUGGESTED
+        with pytest.raises(ValidationError):
+            first.family_confidence.source = "content_analysis"
+        with pytest.raises(ValidationError):
+            first.complexity.operations = ComplexityLevel.HIGH
+
     def test_catalog_serialization(self):
         """Test catalog JSON serialization."""
         entry = ArchitectureEntry(
@@ -274,6 +585,7 @@ class TestCatalogSchema:
         data = json.loads(json_str)
 
         assert data["total_architectures"] == 1
+        assert catalog.generated_at.tzinfo is not None
         assert data["architectures"][0]["architecture_id"] == "test-arch"
         assert "Azure App Service" in data["architectures"][0]["core_services"]
         assert "Azure Monitor" in data["architectures"][0]["supporting_services"]
@@ -294,6 +606,32 @@ class TestCatalogSchema:
 
         assert catalog.total_architectures == 2
 
+        catalog.architectures.append(entry)
+        assert catalog.total_architectures == 3
+        assert catalog.model_dump()["total_architectures"] == 3
+
+    def test_save_catalog_format(self, tmp_path):
+        """Test saved catalogs are pretty-printed UTF-8 JSON that reloads."""
+        from catalog_builder.catalog import CatalogBuilder
+
+        entry = ArchitectureEntry(
+            architecture_id="test-arch",
+            name="Café Ordering",
+            description="Test desc",
+            source_repo_path="docs/test.md",
+            family=ArchitectureFamily.PAAS,
+        )
+        catalog = ArchitectureCatalog(source_repo="/repo", architectures=[entry])
+        output = tmp_path / "catalog.json"
+
+        CatalogBuilder(tmp_path).save_catalog(catalog, output)
+
+        text = output.read_text(encoding="utf-8")
+        assert text == json.dumps(
+            catalog.model_dump(mode="json"), indent=2, ensure_ascii=False
+        )
+        assert ArchitectureCatalog.model_validate_json(text) == catalog
+
 
 class TestEnhancedClassifier:
     """Tests for enhanced content-based classification features."""